@@ -8,15 +8,60 @@ Also exposes run_group_chat() for Pipeline orchestration.
 from __future__ import annotations
 
 import os
-from typing import List
+from functools import lru_cache
+from types import ModuleType
+from typing import List, Optional
 
 from agent_framework.config.schema import AgentConfig
 from agent_framework.core.base_agent import BaseAgent
+from agent_framework.net.http import get_shared_client
 from agent_framework.observability.logger import get_logger
 
 logger = get_logger(__name__)
 
 
+@lru_cache(maxsize=None)
+def _autogen() -> ModuleType:
+    """Import autogen once per process."""
+    try:
+        import autogen
+    except ImportError:
+        raise ImportError(
+            "autogen-agentchat is not installed. "
+            "Install with: pip install 'ms-ai-agent-framework[autogen]'"
+        )
+    return autogen
+
+
+@lru_cache(maxsize=None)
+def _autogen_llm_config(
+    model: str,
+    api_key_env: str,
+    base_url: Optional[str],
+    api_version: Optional[str],
+    temperature: float,
+) -> dict:
+    """
+    Build the llm_config for an endpoint once and share it between agents.
+
+    Callers must treat the returned dict as read-only.
+    """
+    api_key = os.environ.get(api_key_env, "")
+    return {
+        "config_list": [
+            {
+                "model": model,
+                "api_key": api_key,
+                **({"base_url": base_url} if base_url else {}),
+                **({"api_version": api_version} if api_version else {}),
+                # autogen's OpenAI wrapper makes blocking calls, so share the sync pool
+                "http_client": get_shared_client(),
+            }
+        ],
+        "temperature": temperature,
+    }
+
+
 class AutogenAgent(BaseAgent):
     """Single AutoGen AssistantAgent wrapped in the BaseAgent interface."""
 
@@ -24,29 +69,14 @@ class AutogenAgent(BaseAgent):
         super().__init__(config)
         self._assistant = None
         self._proxy = None
+        self._chat_kwargs: dict = {}
         self._build()
 
     def _build(self) -> None:
-        try:
-            import autogen
-        except ImportError:
-            raise ImportError(
-                "autogen-agentchat is not installed. "
-                "Install with: pip install 'ms-ai-agent-framework[autogen]'"
-            )
-
-        api_key = os.environ.get(self.config.llm.api_key_env, "")
-        llm_config: dict = {
-            "config_list": [
-                {
-                    "model": self.config.llm.model,
-                    "api_key": api_key,
-                    **({"base_url": self.config.llm.base_url} if self.config.llm.base_url else {}),
-                    **({"api_version": self.config.llm.api_version} if self.config.llm.api_version else {}),
-                }
-            ],
-            "temperature": self.config.llm.temperature,
-        }
+        autogen = _autogen()
+
+        llm = self.config.llm
+        llm_config = _autogen_llm_config(llm.model, llm.api_key_env, llm.base_url, llm.api_version, llm.temperature)
 
         self._assistant = autogen.AssistantAgent(
             name=self.config.name,
@@ -62,40 +92,49 @@ class AutogenAgent(BaseAgent):
         )
 
         # Register tools with the assistant
-        for fn in self._tools:
-            self._assistant.register_for_llm(description=fn.__doc__ or fn.__name__)(fn)
-            self._proxy.register_for_execution()(fn)
+        for name, fn in self._tools.items():
+            self._register_with_autogen(fn, name)
+
+        # Everything except the user turn is fixed once built: AssistantAgent keeps
+        # the system message as a pre-built message and tool schemas live in its
+        # llm_config, so the provider sees an identical prefix on every run.
+        self._chat_kwargs = {"max_turns": self.config.max_turns, "summary_method": "last_msg"}
+
+    def _register_with_autogen(self, fn, name: str) -> None:
+        fn = self._shared_tool(fn, name)
+        self._assistant.register_for_llm(name=name, description=fn.__doc__ or fn.__name__)(fn)
+        self._proxy.register_for_execution(name=name)(fn)
 
-    def register_tool(self, fn) -> None:
-        super().register_tool(fn)
+    def register_tool(self, fn, name: Optional[str] = None) -> None:
+        super().register_tool(fn, name=name)
         # If already built, register immediately
         if self._assistant is not None:
-            self._assistant.register_for_llm(description=fn.__doc__ or fn.__name__)(fn)
-            self._proxy.register_for_execution()(fn)
+            self._register_with_autogen(fn, name or fn.__name__)
 
     async def run(self, message: str) -> str:
         logger.info("autogen_run", agent=self.name, message_preview=message[:80])
-        chat_result = await self._proxy.a_initiate_chat(
-            self._assistant,
-            message=message,
-            max_turns=self.config.max_turns,
-        )
-        # Return the last assistant message
-        for msg in reversed(chat_result.chat_history):
-            if msg.get("role") == "assistant":
-                return msg.get("content", "")
-        return ""
+        cached, embedding = await self._cache_lookup(message)
+        if cached is not None:
+            logger.debug("autogen_cache_hit", agent=self.name)
+            return cached
+
+        response = await self._complete(message)
+        self._cache_store(embedding, response)
+        return response
+
+    async def _complete(self, message: str) -> str:
+        chat_result = await self._proxy.a_initiate_chat(self._assistant, message=message, **self._chat_kwargs)
+        return _final_reply(chat_result)
 
     async def reset(self) -> None:
-        self._build()
+        """Clear chat state on both agents; registered tools are kept."""
+        self._assistant.reset()
+        self._proxy.reset()
 
 
 async def run_group_chat(agents: List[AutogenAgent], task: str, max_rounds: int = 10) -> str:
     """Run a GroupChat with the given AutogenAgents."""
-    try:
-        import autogen
-    except ImportError:
-        raise ImportError("autogen-agentchat is required for group_chat strategy.")
+    autogen = _autogen()
 
     raw_agents = [a._assistant for a in agents]
     # Add a proxy to kick off the conversation
@@ -116,8 +155,12 @@ async def run_group_chat(agents: List[AutogenAgent], task: str, max_rounds: int
         llm_config=agents[0]._assistant.llm_config,
     )
     chat_result = await proxy.a_initiate_chat(manager, message=task)
+    return _final_reply(chat_result)
+
 
-    for msg in reversed(chat_result.chat_history):
-        if msg.get("role") == "assistant":
-            return msg.get("content", "")
-    return ""
+def _final_reply(chat_result) -> str:
+    """Final reply of a chat: the summary autogen computes during the run, else the last message."""
+    if chat_result.summary:
+        return chat_result.summary
+    history = chat_result.chat_history
+    return (history[-1].get("content") or "") if history else ""
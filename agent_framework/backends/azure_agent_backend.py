@@ -7,15 +7,62 @@ Agents are created idempotently — re-running the same config reuses the existi
 
 from __future__ import annotations
 
+import asyncio
 import os
-from typing import Optional
+from functools import lru_cache
+from types import SimpleNamespace
+from typing import Any, AsyncIterator, Dict, List, Optional
 
 from agent_framework.config.schema import AgentConfig
 from agent_framework.core.base_agent import BaseAgent
+from agent_framework.net.http import get_shared_azure_transport
 from agent_framework.observability.logger import get_logger
 
 logger = get_logger(__name__)
 
+# Credential chain probing and client construction are expensive; share them
+# across every AzureAgent in the process (one client per connection string).
+_CRED_SINGLETON: Any = None
+_CLIENT_CACHE: Dict[str, Any] = {}
+# Agent name → agent object for each client (keyed by id(client)), filled from list_agents().
+_AGENT_INDEX: Dict[int, Dict[str, Any]] = {}
+
+
+@lru_cache(maxsize=None)
+def _azure_sdk() -> SimpleNamespace:
+    """Import the Azure SDK classes this backend uses, once per process."""
+    try:
+        from azure.ai.projects import AIProjectClient
+        from azure.ai.projects.models import MessageDeltaChunk, ThreadRun
+        from azure.identity import DefaultAzureCredential
+    except ImportError:
+        raise ImportError(
+            "azure-ai-projects is not installed. "
+            "Install with: pip install 'ms-ai-agent-framework[azure]'"
+        )
+    return SimpleNamespace(
+        AIProjectClient=AIProjectClient,
+        DefaultAzureCredential=DefaultAzureCredential,
+        MessageDeltaChunk=MessageDeltaChunk,
+        ThreadRun=ThreadRun,
+    )
+
+
+def _get_client(conn_str: str):
+    global _CRED_SINGLETON
+    client = _CLIENT_CACHE.get(conn_str)
+    if client is None:
+        sdk = _azure_sdk()
+        if _CRED_SINGLETON is None:
+            _CRED_SINGLETON = sdk.DefaultAzureCredential()
+        client = sdk.AIProjectClient.from_connection_string(
+            credential=_CRED_SINGLETON,
+            conn_str=conn_str,
+            transport=get_shared_azure_transport(),
+        )
+        _CLIENT_CACHE[conn_str] = client
+    return client
+
 
 class AzureAgent(BaseAgent):
     """Agent hosted on Azure AI Agent Service."""
@@ -25,17 +72,11 @@ class AzureAgent(BaseAgent):
         self._client = None
         self._agent_id: Optional[str] = None
         self._thread_id: Optional[str] = None
+        self._thread_used = False  # any message posted to the current thread
         self._build()
 
     def _build(self) -> None:
-        try:
-            from azure.ai.projects import AIProjectClient
-            from azure.identity import DefaultAzureCredential
-        except ImportError:
-            raise ImportError(
-                "azure-ai-projects is not installed. "
-                "Install with: pip install 'ms-ai-agent-framework[azure]'"
-            )
+        _azure_sdk()
 
         conn_str = os.environ.get("AZURE_AI_PROJECT_CONNECTION_STRING", "")
         if not conn_str:
@@ -44,21 +85,33 @@ class AzureAgent(BaseAgent):
                 "Find it in Azure AI Foundry → your project → Overview."
             )
 
-        self._client = AIProjectClient.from_connection_string(
-            credential=DefaultAzureCredential(),
-            conn_str=conn_str,
-        )
+        self._client = _get_client(conn_str)
         self._ensure_agent()
 
     def _ensure_agent(self) -> None:
         """Create the agent in Azure if it doesn't exist yet (idempotent by name)."""
-        # Check if an agent with this name already exists
-        existing = self._client.agents.list_agents()
-        for ag in existing.data:
-            if ag.name == self.config.name:
-                self._agent_id = ag.id
-                logger.info("azure_agent_reused", name=self.config.name, id=ag.id)
-                return
+        # Check if an agent with this name already exists; the index is refreshed
+        # from the service only on a miss, in case it was created elsewhere.
+        idx = _AGENT_INDEX.get(id(self._client))
+        if idx is None or self.config.name not in idx:
+            existing = self._client.agents.list_agents()
+            idx = _AGENT_INDEX[id(self._client)] = {ag.name: ag for ag in existing.data}
+
+        agent = idx.get(self.config.name)
+        if agent is not None:
+            self._agent_id = agent.id
+            # Instructions live on the service-side agent and form the stable prompt
+            # prefix of every run; bring a reused agent in line with the config once
+            # here rather than overriding instructions per run.
+            if agent.instructions != self.config.instructions:
+                agent = self._client.agents.update_agent(
+                    assistant_id=agent.id,
+                    instructions=self.config.instructions,
+                )
+                idx[self.config.name] = agent
+                logger.info("azure_agent_instructions_updated", name=self.config.name, id=agent.id)
+            logger.info("azure_agent_reused", name=self.config.name, id=agent.id)
+            return
 
         # Build tool list
         tools = []
@@ -77,6 +130,7 @@ class AzureAgent(BaseAgent):
             tools=tools or None,
         )
         self._agent_id = agent.id
+        idx[self.config.name] = agent
         logger.info("azure_agent_created", name=self.config.name, id=agent.id)
 
     def _get_or_create_thread(self) -> str:
@@ -86,25 +140,53 @@ class AzureAgent(BaseAgent):
             logger.debug("azure_thread_created", thread_id=thread.id)
         return self._thread_id
 
-    def register_tool(self, fn) -> None:
-        super().register_tool(fn)
+    def _post_message(self, thread_id: str, role: str, content: str) -> None:
+        self._client.agents.create_message(thread_id=thread_id, role=role, content=content)
+        self._thread_used = True
+
+    def _has_conversation(self) -> bool:
+        return self._thread_used
+
+    async def _record_turn(self, message: str, response: str) -> None:
+        def record() -> None:
+            thread_id = self._get_or_create_thread()
+            self._post_message(thread_id, "user", message)
+            self._post_message(thread_id, "assistant", response)
+
+        await asyncio.to_thread(record)
+
+    def register_tool(self, fn, name: Optional[str] = None) -> None:
+        super().register_tool(fn, name=name)
         # Azure AI Agent Service uses built-in tools; custom function tools
         # would require Azure Functions integration which is wired up separately.
         logger.warning(
             "azure_custom_tool_not_supported",
-            tool=fn.__name__,
+            tool=name or fn.__name__,
             hint="Use azure_builtin_tools in config or wrap as Azure Function.",
         )
 
     async def run(self, message: str) -> str:
         logger.info("azure_run", agent=self.name, message_preview=message[:80])
+        cached, embedding = await self._cache_lookup(message)
+        if cached is not None:
+            logger.debug("azure_cache_hit", agent=self.name)
+            return cached
+
+        response = await self._complete(message)
+        self._cache_store(embedding, response)
+        return response
+
+    async def _complete(self, message: str) -> str:
+        # The SDK client is blocking; keep it off the event loop, which may be
+        # shared by many sessions (e.g. the Gradio UI).
+        return await asyncio.to_thread(self._complete_blocking, message)
+
+    def _complete_blocking(self, message: str) -> str:
+        # Only the user turn is sent per run; the agent's instructions and tools
+        # stay fixed so the provider can serve them from its prompt cache.
         thread_id = self._get_or_create_thread()
 
-        self._client.agents.create_message(
-            thread_id=thread_id,
-            role="user",
-            content=message,
-        )
+        self._post_message(thread_id, "user", message)
 
         run = self._client.agents.create_and_process_run(
             thread_id=thread_id,
@@ -115,11 +197,65 @@ class AzureAgent(BaseAgent):
             logger.error("azure_run_failed", error=run.last_error)
             raise RuntimeError(f"Azure agent run failed: {run.last_error}")
 
-        messages = self._client.agents.list_messages(thread_id=thread_id)
-        last = messages.get_last_text_message_by_role("assistant")
+        last = self._last_reply(thread_id)
         return last.text.value if last else ""
 
+    def _last_reply(self, thread_id: str):
+        """
+        The assistant's newest text message, fetching only the newest message first.
+
+        Falls back to the full listing when that message has no text (e.g. an
+        image produced by code_interpreter) or the SDK has no paging kwargs.
+        """
+        try:
+            newest = self._client.agents.list_messages(thread_id=thread_id, limit=1, order="desc")
+        except TypeError:  # SDK versions without paging kwargs
+            newest = None
+        last = newest.get_last_text_message_by_role("assistant") if newest is not None else None
+        if last is None:
+            messages = self._client.agents.list_messages(thread_id=thread_id)
+            last = messages.get_last_text_message_by_role("assistant")
+        return last
+
+    async def stream(self, message: str) -> AsyncIterator[str]:
+        logger.info("azure_stream", agent=self.name, message_preview=message[:80])
+        cached, embedding = await self._cache_lookup(message)
+        if cached is not None:
+            logger.debug("azure_cache_hit", agent=self.name)
+            yield cached
+            return
+
+        sdk = _azure_sdk()
+
+        def open_stream():
+            thread_id = self._get_or_create_thread()
+            self._post_message(thread_id, "user", message)
+            return self._client.agents.create_stream(thread_id=thread_id, agent_id=self._agent_id)
+
+        chunks: List[str] = []
+        # Opening the stream and reading each event block on the network, so both
+        # happen in worker threads.
+        with await asyncio.to_thread(open_stream) as events:
+            events = iter(events)
+            while True:
+                event = await asyncio.to_thread(next, events, None)
+                if event is None:
+                    break
+                _event_type, event_data, _ = event
+                if isinstance(event_data, sdk.MessageDeltaChunk) and event_data.text:
+                    chunks.append(event_data.text)
+                    yield event_data.text
+                elif isinstance(event_data, sdk.ThreadRun) and event_data.status == "failed":
+                    logger.error("azure_run_failed", error=event_data.last_error)
+                    raise RuntimeError(f"Azure agent run failed: {event_data.last_error}")
+        self._cache_store(embedding, "".join(chunks))
+
+    async def warmup(self) -> None:
+        """Create the conversation thread ahead of the first message."""
+        await asyncio.to_thread(self._get_or_create_thread)
+
     async def reset(self) -> None:
         """Start a fresh thread (conversation history cleared)."""
         self._thread_id = None
+        self._thread_used = False
         logger.info("azure_thread_reset", agent=self.name)
@@ -2,30 +2,62 @@
 
 from __future__ import annotations
 
+from functools import lru_cache
+from typing import TYPE_CHECKING, Callable, Dict, Type
+
 from agent_framework.config.schema import AgentConfig
 from agent_framework.core.base_agent import BaseAgent
 from agent_framework.core.tool_registry import ToolRegistry
 
+if TYPE_CHECKING:
+    from agent_framework.cache.semantic import SemanticCache
+
+
+# Backend classes are imported on first use only, then memoized.
+@lru_cache(maxsize=None)
+def _autogen_cls() -> Type[BaseAgent]:
+    from agent_framework.backends.autogen_backend import AutogenAgent
+    return AutogenAgent
+
+
+@lru_cache(maxsize=None)
+def _semantic_kernel_cls() -> Type[BaseAgent]:
+    from agent_framework.backends.semantic_kernel_backend import SemanticKernelAgent
+    return SemanticKernelAgent
+
+
+@lru_cache(maxsize=None)
+def _azure_cls() -> Type[BaseAgent]:
+    from agent_framework.backends.azure_agent_backend import AzureAgent
+    return AzureAgent
+
+
+_BACKENDS: Dict[str, Callable[[], Type[BaseAgent]]] = {
+    "autogen": _autogen_cls,
+    "semantic_kernel": _semantic_kernel_cls,
+    "azure": _azure_cls,
+}
+
 
-def create_agent(config: AgentConfig, registry: ToolRegistry | None = None) -> BaseAgent:
+def create_agent(
+    config: AgentConfig,
+    registry: ToolRegistry | None = None,
+    cache: SemanticCache | None = None,
+) -> BaseAgent:
     """
     Instantiate the appropriate backend agent for *config*.
 
     If *registry* is provided its tools are injected into the agent after creation.
+    If *cache* is provided, run() answers near-duplicate prompts from it.
     """
-    if config.backend == "autogen":
-        from agent_framework.backends.autogen_backend import AutogenAgent
-        agent = AutogenAgent(config)
-    elif config.backend == "semantic_kernel":
-        from agent_framework.backends.semantic_kernel_backend import SemanticKernelAgent
-        agent = SemanticKernelAgent(config)
-    elif config.backend == "azure":
-        from agent_framework.backends.azure_agent_backend import AzureAgent
-        agent = AzureAgent(config)
-    else:
+    backend_cls = _BACKENDS.get(config.backend)
+    if backend_cls is None:
         raise ValueError(f"Unknown backend: {config.backend!r}. Choose autogen | semantic_kernel | azure")
+    agent = backend_cls()(config)
 
     if registry:
         registry.inject(agent)
+    if cache is not None:
+        agent.set_cache(cache)
 
     return agent
@@ -6,16 +6,80 @@ Creates a Kernel with OpenAIChatCompletion and wraps tools as KernelPlugins.
 
 from __future__ import annotations
 
+import asyncio
 import os
-from typing import Callable, List
+from contextlib import asynccontextmanager
+from functools import lru_cache
+from types import SimpleNamespace
+from typing import AsyncIterator, Callable, List, Optional
 
 from agent_framework.config.schema import AgentConfig
 from agent_framework.core.base_agent import BaseAgent
+from agent_framework.net.http import get_shared_async_client
 from agent_framework.observability.logger import get_logger
 
 logger = get_logger(__name__)
 
 
+@lru_cache(maxsize=None)
+def _semantic_kernel() -> SimpleNamespace:
+    """Import the semantic-kernel classes this backend uses, once per process."""
+    try:
+        from semantic_kernel import Kernel
+        from semantic_kernel.agents import ChatCompletionAgent
+        from semantic_kernel.connectors.ai.open_ai import OpenAIChatCompletion, AzureChatCompletion
+        from semantic_kernel.contents import ChatHistory
+        from openai import AsyncAzureOpenAI, AsyncOpenAI
+    except ImportError:
+        raise ImportError(
+            "semantic-kernel is not installed. "
+            "Install with: pip install 'ms-ai-agent-framework[semantic-kernel]'"
+        )
+    return SimpleNamespace(
+        Kernel=Kernel,
+        ChatCompletionAgent=ChatCompletionAgent,
+        OpenAIChatCompletion=OpenAIChatCompletion,
+        AzureChatCompletion=AzureChatCompletion,
+        ChatHistory=ChatHistory,
+        AsyncOpenAI=AsyncOpenAI,
+        AsyncAzureOpenAI=AsyncAzureOpenAI,
+    )
+
+
+@lru_cache(maxsize=None)
+def _openai_service(model: str, api_key_env: str, base_url: Optional[str], api_version: Optional[str]):
+    """
+    Return the chat-completion service for an endpoint, shared by every agent using it.
+
+    The key deliberately excludes per-agent settings (name, instructions) so all
+    agents of one endpoint share a single service and HTTP connection pool.
+    """
+    sk = _semantic_kernel()
+    api_key = os.environ.get(api_key_env, "")
+    http_client = get_shared_async_client()
+    if base_url and "azure" in base_url.lower():
+        api_version = api_version or "2024-02-01"
+        return sk.AzureChatCompletion(
+            service_id="chat",
+            deployment_name=model,
+            endpoint=base_url,
+            api_key=api_key,
+            api_version=api_version,
+            async_client=sk.AsyncAzureOpenAI(
+                api_key=api_key,
+                azure_endpoint=base_url,
+                api_version=api_version,
+                http_client=http_client,
+            ),
+        )
+    return sk.OpenAIChatCompletion(
+        service_id="chat",
+        ai_model_id=model,
+        api_key=api_key,
+        async_client=sk.AsyncOpenAI(api_key=api_key, http_client=http_client),
+    )
+
+
 class SemanticKernelAgent(BaseAgent):
     """Agent backed by Microsoft Semantic Kernel."""
 
@@ -24,53 +88,31 @@ class SemanticKernelAgent(BaseAgent):
         self._kernel = None
         self._agent = None
         self._pending_tools: List[Callable] = []
+        self._history = None
+        self._history_lock = asyncio.Lock()
         self._build()
 
     def _build(self) -> None:
-        try:
-            from semantic_kernel import Kernel
-            from semantic_kernel.connectors.ai.open_ai import OpenAIChatCompletion, AzureChatCompletion
-            from semantic_kernel.agents import ChatCompletionAgent
-        except ImportError:
-            raise ImportError(
-                "semantic-kernel is not installed. "
-                "Install with: pip install 'ms-ai-agent-framework[semantic-kernel]'"
-            )
-
-        kernel = Kernel()
-
-        api_key = os.environ.get(self.config.llm.api_key_env, "")
-
-        if self.config.llm.base_url and "azure" in self.config.llm.base_url.lower():
-            service = AzureChatCompletion(
-                service_id="chat",
-                deployment_name=self.config.llm.model,
-                endpoint=self.config.llm.base_url,
-                api_key=api_key,
-                api_version=self.config.llm.api_version or "2024-02-01",
-            )
-        else:
-            service = OpenAIChatCompletion(
-                service_id="chat",
-                ai_model_id=self.config.llm.model,
-                api_key=api_key,
-            )
+        sk = _semantic_kernel()
 
+        kernel = sk.Kernel()
+        llm = self.config.llm
+        service = _openai_service(llm.model, llm.api_key_env, llm.base_url, llm.api_version)
         kernel.add_service(service)
 
         # Register already-known tools
-        for fn in self._tools:
-            self._add_plugin(kernel, fn)
+        for name, fn in self._tools.items():
+            self._add_plugin(kernel, fn, name)
 
         self._kernel = kernel
-        self._agent = ChatCompletionAgent(
+        self._agent = sk.ChatCompletionAgent(
             service=service,
             kernel=kernel,
             name=self.config.name,
             instructions=self.config.instructions,
         )
 
-    def _add_plugin(self, kernel, fn: Callable) -> None:
+    def _add_plugin(self, kernel, fn: Callable, name: str) -> None:
         """Wrap a plain function as a KernelPlugin and add it to the kernel."""
         try:
             from semantic_kernel.functions import kernel_function
@@ -78,27 +120,93 @@ class SemanticKernelAgent(BaseAgent):
         except ImportError:
             return
 
+        fn = self._shared_tool(fn, name)
         # Decorate with kernel_function if not already decorated
         if not hasattr(fn, "__kernel_function__"):
-            fn = kernel_function(description=fn.__doc__ or fn.__name__)(fn)
+            fn = kernel_function(name=name, description=fn.__doc__ or fn.__name__)(fn)
 
-        plugin = KernelPlugin.from_object(plugin_instance=None, plugin_name=fn.__name__, functions=[fn])
+        plugin = KernelPlugin.from_object(plugin_instance=None, plugin_name=name, functions=[fn])
         kernel.add_plugin(plugin)
 
-    def register_tool(self, fn: Callable) -> None:
-        super().register_tool(fn)
+    def register_tool(self, fn: Callable, name: Optional[str] = None) -> None:
+        super().register_tool(fn, name=name)
         if self._kernel is not None:
-            self._add_plugin(self._kernel, fn)
+            self._add_plugin(self._kernel, fn, name or fn.__name__)
 
     async def run(self, message: str) -> str:
         logger.info("sk_run", agent=self.name, message_preview=message[:80])
-        from semantic_kernel.contents import ChatHistory
+        cached, embedding = await self._cache_lookup(message)
+        if cached is not None:
+            logger.debug("sk_cache_hit", agent=self.name)
+            return cached
+
+        response = await self._complete(message)
+        self._cache_store(embedding, response)
+        return response
+
+    async def _complete(self, message: str) -> str:
+        async with self._turn(message) as history:
+            response = str(await self._agent.get_response(messages=history))
+            history.add_assistant_message(response)
+        return response
+
+    async def stream(self, message: str) -> AsyncIterator[str]:
+        logger.info("sk_stream", agent=self.name, message_preview=message[:80])
+        cached, embedding = await self._cache_lookup(message)
+        if cached is not None:
+            logger.debug("sk_cache_hit", agent=self.name)
+            yield cached
+            return
 
-        history = ChatHistory()
-        history.add_user_message(message)
+        chunks: List[str] = []
+        async with self._turn(message) as history:
+            async for chunk in self._agent.invoke_stream(messages=history):
+                text = str(chunk)
+                if text:
+                    chunks.append(text)
+                    yield text
+            response = "".join(chunks)
+            history.add_assistant_message(response)
+        self._cache_store(embedding, response)
+
+    def _has_conversation(self) -> bool:
+        return self._history is not None
+
+    async def _record_turn(self, message: str, response: str) -> None:
+        async with self._turn(message) as history:
+            history.add_assistant_message(response)
+
+    @asynccontextmanager
+    async def _turn(self, message: str):
+        """
+        Yield the history to send with *message* appended as the next user turn.
+
+        With keep_history this is the persistent conversation, held under a lock
+        for the whole turn; a turn that fails is removed again. Otherwise every
+        call gets a fresh single-message history.
+        """
+        sk = _semantic_kernel()
+        if not self._keep_history:
+            history = sk.ChatHistory()
+            history.add_user_message(message)
+            yield history
+            return
 
-        response = await self._agent.get_response(messages=history)
-        return str(response)
+        async with self._history_lock:
+            # The history only grows, so earlier turns form a stable prefix that
+            # provider-side prompt caching can reuse. Instructions are prepended by
+            # ChatCompletionAgent itself and are therefore not stored here.
+            if self._history is None:
+                self._history = sk.ChatHistory()
+            history = self._history
+            start = len(history.messages)
+            history.add_user_message(message)
+            try:
+                yield history
+            except BaseException:
+                del history.messages[start:]
+                raise
 
     async def reset(self) -> None:
-        self._build()
+        """Drop the conversation history; the kernel, service and plugins are kept."""
+        self._history = None
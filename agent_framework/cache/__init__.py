@@ -0,0 +1,3 @@
+from .semantic import SemanticCache, InMemoryStore, SQLiteStore
+
+__all__ = ["SemanticCache", "InMemoryStore", "SQLiteStore"]
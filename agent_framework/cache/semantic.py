@@ -0,0 +1,110 @@
+"""
+Semantic response cache — reuse an agent's answer for near-duplicate prompts.
+
+Usage:
+    from agent_framework.cache import SemanticCache, SQLiteStore
+
+    cache = SemanticCache(embed_fn=my_embed, store=SQLiteStore(".agent_cache.db"))
+    agent = create_agent(config, registry, cache=cache)
+
+*embed_fn* is any callable mapping text to a vector of floats (an OpenAI / Azure
+embedding call, a local sentence-transformer, ...). A prompt whose embedding has
+cosine similarity >= *threshold* with a cached prompt in the same namespace is
+answered from the cache without calling the LLM.
+"""
+
+from __future__ import annotations
+
+import math
+import sqlite3
+import threading
+from array import array
+from typing import Callable, Dict, Iterable, List, Optional, Sequence, Tuple
+
+EmbedFn = Callable[[str], Sequence[float]]
+Vector = List[float]
+
+
+def _normalize(vector: Sequence[float]) -> Vector:
+    norm = math.sqrt(sum(x * x for x in vector))
+    if norm == 0.0:
+        return [0.0 for _ in vector]
+    return [x / norm for x in vector]
+
+
+def _dot(a: Sequence[float], b: Sequence[float]) -> float:
+    return sum(x * y for x, y in zip(a, b))
+
+
+class InMemoryStore:
+    """Process-local store; entries are lost when the process exits."""
+
+    def __init__(self) -> None:
+        self._entries: Dict[str, List[Tuple[Vector, str]]] = {}
+        self._lock = threading.Lock()
+
+    def add(self, namespace: str, vector: Vector, response: str) -> None:
+        with self._lock:
+            self._entries.setdefault(namespace, []).append((vector, response))
+
+    def items(self, namespace: str) -> Iterable[Tuple[Vector, str]]:
+        with self._lock:
+            return list(self._entries.get(namespace, ()))
+
+
+class SQLiteStore:
+    """Persistent store backed by a single SQLite file (or ``:memory:``)."""
+
+    def __init__(self, path: str = ":memory:") -> None:
+        self._conn = sqlite3.connect(path, check_same_thread=False)
+        self._lock = threading.Lock()
+        with self._lock, self._conn:
+            self._conn.execute(
+                "CREATE TABLE IF NOT EXISTS semantic_cache ("
+                "namespace TEXT NOT NULL, vector BLOB NOT NULL, response TEXT NOT NULL)"
+            )
+            self._conn.execute(
+                "CREATE INDEX IF NOT EXISTS semantic_cache_ns ON semantic_cache (namespace)"
+            )
+
+    def add(self, namespace: str, vector: Vector, response: str) -> None:
+        blob = array("d", vector).tobytes()
+        with self._lock, self._conn:
+            self._conn.execute(
+                "INSERT INTO semantic_cache (namespace, vector, response) VALUES (?, ?, ?)",
+                (namespace, blob, response),
+            )
+
+    def items(self, namespace: str) -> Iterable[Tuple[Vector, str]]:
+        with self._lock:
+            rows = self._conn.execute(
+                "SELECT vector, response FROM semantic_cache WHERE namespace = ?", (namespace,)
+            ).fetchall()
+        return [(array("d", blob).tolist(), response) for blob, response in rows]
+
+
+class SemanticCache:
+    """Embedding + cosine-similarity cache of agent responses."""
+
+    def __init__(self, embed_fn: EmbedFn, store=None, threshold: float = 0.92) -> None:
+        if not 0.0 < threshold <= 1.0:
+            raise ValueError(f"threshold must be in (0, 1], got {threshold}")
+        self.embed_fn = embed_fn
+        self.store = store if store is not None else InMemoryStore()
+        self.threshold = threshold
+
+    def embed(self, text: str) -> Vector:
+        """Return the unit-length embedding of *text*."""
+        return _normalize(self.embed_fn(text))
+
+    def lookup(self, namespace: str, embedding: Vector) -> Optional[str]:
+        """Return the closest cached response above the threshold, or None."""
+        best_score, best = self.threshold, None
+        for vector, response in self.store.items(namespace):
+            score = _dot(vector, embedding)
+            if score >= best_score:
+                best_score, best = score, response
+        return best
+
+    def put(self, namespace: str, embedding: Vector, response: str) -> None:
+        self.store.add(namespace, embedding, response)
@@ -20,6 +20,9 @@ from __future__ import annotations
 import asyncio
 import os
 import sys
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
 from pathlib import Path
 
 import click
@@ -28,6 +31,8 @@ from agent_framework.observability.logger import get_logger, setup_telemetry
 
 logger = get_logger(__name__)
 
+_CONFIG_SUFFIXES = {".yaml", ".yml", ".json"}
+
 
 # ---------------------------------------------------------------------------
 # Root group
@@ -258,19 +263,25 @@ def list_agents(agents_dir: str):
         click.secho(f"Directory not found: {path}", fg="red")
         sys.exit(1)
 
-    files = sorted(path.glob("*.yaml")) + sorted(path.glob("*.yml")) + sorted(path.glob("*.json"))
+    files = sorted(f for f in path.iterdir() if f.suffix in _CONFIG_SUFFIXES and f.is_file())
     if not files:
         click.echo("No agent configs found.")
         return
 
+    def _safe_load(f: Path):
+        try:
+            return f, load_agent_config(f)
+        except Exception:
+            return f, None  # pipeline configs and malformed files are skipped silently
+
+    with ThreadPoolExecutor() as ex:
+        results = list(ex.map(_safe_load, files))
+
     click.secho(f"{'NAME':<25} {'BACKEND':<18} {'MODEL':<15} FILE", bold=True)
     click.echo("-" * 80)
-    for f in files:
-        try:
-            cfg = load_agent_config(f)
+    for f, cfg in results:
+        if cfg is not None:
             click.echo(f"{cfg.name:<25} {cfg.backend:<18} {cfg.llm.model:<15} {f}")
-        except Exception:
-            pass  # skip pipeline configs and malformed files silently
 
 
 # ---------------------------------------------------------------------------
@@ -289,6 +300,7 @@ def chat(config: str, no_color: bool):
     agent_config = load_agent_config(config)
     registry = ToolRegistry.from_agent_config(agent_config)
     agent = create_agent(agent_config, registry)
+    agent.set_keep_history(True)
 
     def out(text, **kwargs):
         if no_color:
@@ -299,31 +311,58 @@ def chat(config: str, no_color: bool):
     out(f"\nChatting with '{agent.name}' [{agent_config.backend}]", fg="cyan", bold=True)
     out("Type 'exit' or 'quit' to stop. Type 'reset' to clear conversation history.\n", fg="yellow")
 
-    while True:
-        try:
-            user_input = click.prompt(click.style("You", fg="green", bold=True) if not no_color else "You")
-        except (KeyboardInterrupt, EOFError):
-            out("\nGoodbye!", fg="yellow")
-            break
-
-        user_input = user_input.strip()
-        if not user_input:
-            continue
-        if user_input.lower() in ("exit", "quit"):
-            out("Goodbye!", fg="yellow")
-            break
-        if user_input.lower() == "reset":
-            asyncio.run(agent.reset())
-            out("[Conversation history cleared]", fg="yellow")
-            continue
+    prompt_label = click.style("You", fg="green", bold=True) if not no_color else "You"
 
-        try:
-            response = asyncio.run(agent.run(user_input))
-            out(f"\nAgent: ", fg="blue", bold=True, nl=False)
-            click.echo(response)
-            click.echo()
-        except Exception as exc:
-            out(f"[Error] {exc}", fg="red")
+    async def session():
+        # Prime the agent (threads, connections) while the user types the first message.
+        warmup = asyncio.ensure_future(agent.warmup())
+        warmup.add_done_callback(_log_warmup_failure)
+        read_line = _line_reader(prompt_label)
+        while True:
+            try:
+                user_input = await read_line()
+            except (KeyboardInterrupt, EOFError, click.Abort):
+                out("\nGoodbye!", fg="yellow")
+                break
+
+            user_input = user_input.strip()
+            if not user_input:
+                continue
+            if user_input.lower() in ("exit", "quit"):
+                out("Goodbye!", fg="yellow")
+                break
+
+            if not warmup.done():
+                await asyncio.wait([warmup])
+            if user_input.lower() == "reset":
+                await agent.reset()
+                out("[Conversation history cleared]", fg="yellow")
+                continue
+
+            try:
+                response = await agent.run(user_input)
+                out(f"\nAgent: ", fg="blue", bold=True, nl=False)
+                click.echo(response)
+                click.echo()
+            except Exception as exc:
+                out(f"[Error] {exc}", fg="red")
+
+    # One loop for the whole session so SDK clients and their connection pools
+    # survive between turns instead of being torn down by asyncio.run().
+    loop = asyncio.new_event_loop()
+    try:
+        loop.run_until_complete(session())
+    except KeyboardInterrupt:
+        out("\nGoodbye!", fg="yellow")
+    finally:
+        # Ctrl+C leaves the session, its warm-up and any open prompt pending;
+        # cancel them so nothing touches the loop after it is closed.
+        pending = asyncio.all_tasks(loop)
+        for task in pending:
+            task.cancel()
+        if pending:
+            loop.run_until_complete(asyncio.gather(*pending, return_exceptions=True))
+        loop.close()
 
 
 # ---------------------------------------------------------------------------
@@ -345,19 +384,14 @@ def ui(config: str, port: int, share: bool):
         )
         sys.exit(1)
 
-    from agent_framework.config.loader import load_agent_config
-    from agent_framework.backends.factory import create_agent
-    from agent_framework.core.tool_registry import ToolRegistry
-
-    agent_config = load_agent_config(config)
-    registry = ToolRegistry.from_agent_config(agent_config)
-    agent = create_agent(agent_config, registry)
-
-    async def respond(message: str, history: list) -> str:
-        return await agent.run(message)
+    agent = _get_agent(str(Path(config).resolve()))
+    agent_config = agent.config
+    # Gradio calls handlers from worker threads; run every agent coroutine on one
+    # long-lived loop so the agent's clients stay bound to a single loop.
+    loop = _background_loop()
 
     def reset_agent():
-        asyncio.run(agent.reset())
+        asyncio.run_coroutine_threadsafe(agent.reset(), loop).result()
         return [], ""
 
     with gr.Blocks(title=f"cre-agent: {agent.name}", theme=gr.themes.Soft()) as demo:
@@ -399,14 +433,17 @@ def ui(config: str, port: int, share: bool):
 
         def bot_reply(history):
             if not history:
-                return history
+                yield history
+                return
             last_user = history[-1]["content"]
+            history.append({"role": "assistant", "content": ""})
             try:
-                response = asyncio.run(agent.run(last_user))
+                for chunk in _iter_on_loop(agent.stream(last_user), loop):
+                    history[-1]["content"] += chunk
+                    yield history
             except Exception as exc:
-                response = f"[Error] {exc}"
-            history.append({"role": "assistant", "content": response})
-            return history
+                history[-1]["content"] += f"[Error] {exc}"
+                yield history
 
         msg_box.submit(user_submit, [msg_box, chatbot], [chatbot, msg_box]).then(
             bot_reply, chatbot, chatbot
@@ -445,5 +482,90 @@ def _write_if_missing(path: Path, content: str) -> None:
         click.echo(f"  created {path}")
 
 
+@lru_cache(maxsize=None)
+def _get_agent(config_path: str):
+    """Build the agent for *config_path* once per process; reset() clears its history."""
+    from agent_framework.config.loader import load_agent_config
+    from agent_framework.backends.factory import create_agent
+    from agent_framework.core.tool_registry import ToolRegistry
+
+    agent_config = load_agent_config(config_path)
+    agent = create_agent(agent_config, ToolRegistry.from_agent_config(agent_config))
+    agent.set_keep_history(True)
+    return agent
+
+
+def _log_warmup_failure(task: asyncio.Future) -> None:
+    # A failed warm-up is not fatal: the first run() simply does the work itself.
+    if not task.cancelled() and task.exception() is not None:
+        logger.warning("agent_warmup_failed", error=str(task.exception()))
+
+
+def _line_reader(label: str):
+    """
+    Return an async ``read_line()`` for the chat prompt.
+
+    Uses prompt_toolkit's async session when installed; otherwise click.prompt
+    runs in a daemon thread. Either way the event loop keeps running while the
+    user types.
+    """
+    try:
+        from prompt_toolkit import PromptSession
+        from prompt_toolkit.formatted_text import ANSI
+    except ImportError:
+        PromptSession = None
+
+    if PromptSession is not None and sys.stdin.isatty():
+        prompt_session = PromptSession()
+
+        async def read_line() -> str:
+            return await prompt_session.prompt_async(ANSI(f"{label}: "))
+
+        return read_line
+
+    async def read_line() -> str:
+        loop = asyncio.get_running_loop()
+        future = loop.create_future()
+
+        def settle(setter, value) -> None:
+            if not future.done():  # cancelled when the chat ends while the prompt is open
+                setter(value)
+
+        def target():
+            try:
+                outcome = (future.set_result, click.prompt(label))
+            except BaseException as exc:
+                outcome = (future.set_exception, exc)
+            try:
+                loop.call_soon_threadsafe(settle, *outcome)
+            except RuntimeError:  # the loop has been closed
+                pass
+
+        threading.Thread(target=target, name="chat-prompt", daemon=True).start()
+        return await future
+
+    return read_line
+
+
+@lru_cache(maxsize=None)
+def _background_loop() -> asyncio.AbstractEventLoop:
+    """Process-wide event loop in a daemon thread; submit work with run_coroutine_threadsafe."""
+    loop = asyncio.new_event_loop()
+    threading.Thread(target=loop.run_forever, name="agent-event-loop", daemon=True).start()
+    return loop
+
+
+def _iter_on_loop(agen, loop: asyncio.AbstractEventLoop):
+    """Iterate async generator *agen* on *loop* (running in another thread) from sync code."""
+    try:
+        while True:
+            try:
+                yield asyncio.run_coroutine_threadsafe(agen.__anext__(), loop).result()
+            except StopAsyncIteration:
+                return
+    finally:
+        asyncio.run_coroutine_threadsafe(agen.aclose(), loop).result()
+
+
 if __name__ == "__main__":
     cli()
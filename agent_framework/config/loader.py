@@ -3,33 +3,86 @@
 from __future__ import annotations
 
 import json
+import mmap
+import os
+from contextlib import contextmanager
 from pathlib import Path
-from typing import Union
-
-import yaml
+from typing import Any, Dict, Iterator, Tuple, Union
 
 from .schema import AgentConfig, PipelineConfig
 
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+
+# Resolved path → ((st_mtime_ns, st_size), validated model). Loaders hand out the
+# cached instance, so a re-read of an unchanged file costs one stat() call.
+_AGENT_CACHE: Dict[str, Tuple[Tuple[int, int], AgentConfig]] = {}
+_PIPELINE_CACHE: Dict[str, Tuple[Tuple[int, int], PipelineConfig]] = {}
+
+
+# Smaller files are read in one call; mapping them costs more than the copy it saves.
+_MMAP_MIN_SIZE = 4096
+
+
+@contextmanager
+def _open_buffer(path: Path) -> Iterator[Union[bytes, mmap.mmap]]:
+    """Yield the file's contents: bytes for small files, a read-only mmap for large ones."""
+    try:
+        f = path.open("rb")
+    except FileNotFoundError:
+        raise FileNotFoundError(f"Config file not found: {path}") from None
+    with f:
+        if os.fstat(f.fileno()).st_size < _MMAP_MIN_SIZE:
+            yield f.read()
+            return
+        try:
+            mm = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        except (OSError, ValueError):  # file systems that can't be mapped
+            yield f.read()
+            return
+        with mm:
+            yield mm
+
 
 def _read_file(path: Union[str, Path]) -> dict:
     path = Path(path)
-    if not path.exists():
-        raise FileNotFoundError(f"Config file not found: {path}")
-    text = path.read_text()
     if path.suffix in (".yaml", ".yml"):
-        return yaml.safe_load(text)
+        from .yaml_reader import load_yaml  # PyYAML is only imported for YAML configs
+        with _open_buffer(path) as buf:
+            return load_yaml(buf)
     if path.suffix == ".json":
-        return json.loads(text)
+        with _open_buffer(path) as buf:
+            if orjson is not None:
+                with memoryview(buf) as view:
+                    return orjson.loads(view)
+            return json.loads(buf[:])
     raise ValueError(f"Unsupported config format: {path.suffix}. Use .yaml, .yml, or .json")
 
 
+def _load_cached(path: Union[str, Path], cache: Dict[str, Tuple[Tuple[int, int], Any]], model):
+    path = Path(path)
+    try:
+        st = path.stat()
+    except FileNotFoundError:
+        raise FileNotFoundError(f"Config file not found: {path}") from None
+    key = str(path.resolve())
+    stamp = (st.st_mtime_ns, st.st_size)
+    entry = cache.get(key)
+    if entry is not None and entry[0] == stamp:
+        return entry[1]
+    cfg = model.model_validate(_read_file(path))
+    cache[key] = (stamp, cfg)
+    return cfg
+
+
 def load_agent_config(path: Union[str, Path]) -> AgentConfig:
-    """Load and validate an AgentConfig from a YAML or JSON file."""
-    data = _read_file(path)
-    return AgentConfig.model_validate(data)
+    """Load and validate an AgentConfig from a YAML or JSON file (cached until the file changes)."""
+    return _load_cached(path, _AGENT_CACHE, AgentConfig)
 
 
 def load_pipeline_config(path: Union[str, Path]) -> PipelineConfig:
-    """Load and validate a PipelineConfig from a YAML or JSON file."""
-    data = _read_file(path)
-    return PipelineConfig.model_validate(data)
+    """Load and validate a PipelineConfig from a YAML or JSON file (cached until the file changes)."""
+    return _load_cached(path, _PIPELINE_CACHE, PipelineConfig)
@@ -3,19 +3,30 @@
 from __future__ import annotations
 
 from typing import Any, Dict, List, Literal, Optional
-from pydantic import BaseModel, Field, model_validator
+from pydantic import BaseModel, ConfigDict, Field, model_validator
+
+# Configs are validated once and then only read (loaders hand out cached
+# instances), so every model is immutable.
+_FROZEN = ConfigDict(frozen=True)
 
 
 class ToolConfig(BaseModel):
     """Defines a tool/function the agent can call."""
+    model_config = _FROZEN
+
     name: str = Field(description="Unique tool name")
     module: str = Field(description="Python module path, e.g. 'tools.web_search'")
     function: str = Field(description="Function name within the module")
     description: Optional[str] = Field(default=None, description="Human-readable description for the LLM")
+    cache_ttl: float = Field(
+        default=0, ge=0, description="Seconds to share this tool's results across agents (0 disables)"
+    )
 
 
 class LLMConfig(BaseModel):
     """LLM connection settings."""
+    model_config = _FROZEN
+
     model: str = Field(default="gpt-4o", description="Model name, e.g. gpt-4o")
     api_key_env: str = Field(default="OPENAI_API_KEY", description="Env var name holding the API key")
     base_url: Optional[str] = Field(default=None, description="Custom API base URL (Azure OpenAI etc.)")
@@ -26,6 +37,8 @@ class LLMConfig(BaseModel):
 
 class AgentConfig(BaseModel):
     """Full configuration for a single agent."""
+    model_config = _FROZEN
+
     name: str = Field(description="Unique agent name")
     backend: Literal["autogen", "semantic_kernel", "azure"] = Field(
         description="Which Microsoft framework powers this agent"
@@ -42,15 +55,20 @@ class AgentConfig(BaseModel):
     # Extra backend-specific kwargs passed through verbatim
     extra: Dict[str, Any] = Field(default_factory=dict)
 
-    @model_validator(mode="after")
-    def validate_azure_tools(self) -> "AgentConfig":
-        if self.azure_builtin_tools and self.backend != "azure":
+    # Cross-field checks run on the raw input, before field validation, so a
+    # misconfigured document is rejected without building llm/tools/extra first.
+    @model_validator(mode="before")
+    @classmethod
+    def validate_azure_tools(cls, data: Any) -> Any:
+        if isinstance(data, dict) and data.get("azure_builtin_tools") and data.get("backend") != "azure":
             raise ValueError("azure_builtin_tools can only be used with the 'azure' backend")
-        return self
+        return data
 
 
 class PipelineConfig(BaseModel):
     """Configuration for a multi-agent pipeline."""
+    model_config = _FROZEN
+
     name: str
     agents: List[str] = Field(description="Ordered list of agent names (from agent config files)")
     strategy: Literal["sequential", "group_chat", "supervisor"] = Field(
@@ -66,15 +84,18 @@ class PipelineConfig(BaseModel):
         default=None, description="Name of the supervisor agent (required for supervisor strategy)"
     )
 
-    @model_validator(mode="after")
-    def validate_supervisor(self) -> "PipelineConfig":
-        if self.strategy == "supervisor" and not self.supervisor_agent:
+    @model_validator(mode="before")
+    @classmethod
+    def validate_supervisor(cls, data: Any) -> Any:
+        if isinstance(data, dict) and data.get("strategy") == "supervisor" and not data.get("supervisor_agent"):
             raise ValueError("supervisor_agent must be set when strategy is 'supervisor'")
-        return self
+        return data
 
 
 class DeployConfig(BaseModel):
     """Deployment target configuration, embedded in agent config or standalone."""
+    model_config = _FROZEN
+
     target: Literal["local", "docker", "azure"] = "local"
     port: int = Field(default=8080, description="Port to expose the agent HTTP server")
     # Docker
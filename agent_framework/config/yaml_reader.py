@@ -0,0 +1,134 @@
+"""
+YAML reading for config files, imported only when a .yaml/.yml file is loaded.
+
+Documents are built into dicts/lists straight from libyaml's parser events,
+skipping PyYAML's intermediate Node graph.
+"""
+
+from __future__ import annotations
+
+from typing import Any, BinaryIO, Union
+
+import yaml
+from yaml.constructor import SafeConstructor
+from yaml.events import (
+    AliasEvent,
+    DocumentStartEvent,
+    MappingEndEvent,
+    MappingStartEvent,
+    ScalarEvent,
+    SequenceEndEvent,
+    SequenceStartEvent,
+    StreamEndEvent,
+)
+from yaml.nodes import ScalarNode
+from yaml.resolver import Resolver
+
+# LibYAML-backed loader when PyYAML was built with it (the default for wheels).
+try:
+    from yaml import CSafeLoader as _YamlLoader
+    from yaml.cyaml import CParser
+except ImportError:  # PyYAML built without LibYAML
+    from yaml import SafeLoader as _YamlLoader
+    CParser = None
+
+_RESOLVER = Resolver()
+_CONSTRUCTOR = SafeConstructor()
+_NO_KEY = object()
+
+
+def _via_constructor(method):
+    return lambda tag, value: method(_CONSTRUCTOR, ScalarNode(tag, value))
+
+
+# Native conversions for the scalar types SafeLoader resolves implicitly; numbers and
+# timestamps go through SafeConstructor so YAML 1.1 forms (0x1f, 1_000, .inf) match.
+_SCALARS = {
+    "tag:yaml.org,2002:str": lambda tag, value: value,
+    "tag:yaml.org,2002:null": lambda tag, value: None,
+    "tag:yaml.org,2002:bool": lambda tag, value: SafeConstructor.bool_values[value.lower()],
+    "tag:yaml.org,2002:int": _via_constructor(SafeConstructor.construct_yaml_int),
+    "tag:yaml.org,2002:float": _via_constructor(SafeConstructor.construct_yaml_float),
+    "tag:yaml.org,2002:timestamp": _via_constructor(SafeConstructor.construct_yaml_timestamp),
+}
+
+
+class _NeedsFullLoader(Exception):
+    """The document uses a feature the event fast path leaves to PyYAML's constructor."""
+
+
+def load_yaml(data: Union[bytes, BinaryIO]) -> Any:
+    """
+    Parse a YAML document, equivalent to ``yaml.load(data, Loader=CSafeLoader)``.
+
+    *data* is bytes or a seekable binary stream (e.g. an mmap). Documents with
+    aliases, explicit tags, merge keys, complex keys or several documents are
+    handed to the regular loader, so the result (or error) is always what
+    ``yaml.load(..., CSafeLoader)`` gives.
+    """
+    if CParser is None:
+        return yaml.load(data, Loader=_YamlLoader)
+    parser = CParser(data)
+    try:
+        return _build_from_events(parser)
+    except _NeedsFullLoader:
+        if not isinstance(data, bytes):
+            data.seek(0)
+        return yaml.load(data, Loader=_YamlLoader)
+    finally:
+        parser.dispose()
+
+
+def _build_from_events(parser) -> Any:
+    root = None
+    stack: list = []  # containers being filled, innermost last
+    keys: list = []   # pending mapping key per stack entry (_NO_KEY when none)
+    documents = 0
+
+    def add(value: Any) -> None:
+        nonlocal root
+        if not stack:
+            root = value
+            return
+        top = stack[-1]
+        if type(top) is list:
+            top.append(value)
+        elif keys[-1] is _NO_KEY:
+            try:
+                hash(value)
+            except TypeError:
+                raise _NeedsFullLoader
+            keys[-1] = value
+        else:
+            top[keys[-1]] = value
+            keys[-1] = _NO_KEY
+
+    while True:
+        event = parser.get_event()
+        kind = type(event)
+        if kind is ScalarEvent:
+            if event.tag is not None:
+                raise _NeedsFullLoader
+            tag = _RESOLVER.resolve(ScalarNode, event.value, event.implicit)
+            convert = _SCALARS.get(tag)
+            if convert is None:  # merge key, value key
+                raise _NeedsFullLoader
+            add(convert(tag, event.value))
+        elif kind is MappingStartEvent or kind is SequenceStartEvent:
+            if event.tag is not None:
+                raise _NeedsFullLoader
+            container = {} if kind is MappingStartEvent else []
+            add(container)
+            stack.append(container)
+            keys.append(_NO_KEY)
+        elif kind is MappingEndEvent or kind is SequenceEndEvent:
+            stack.pop()
+            keys.pop()
+        elif kind is AliasEvent:
+            raise _NeedsFullLoader
+        elif kind is DocumentStartEvent:
+            documents += 1
+            if documents > 1:
+                raise _NeedsFullLoader
+        elif kind is StreamEndEvent:
+            return root
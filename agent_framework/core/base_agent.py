@@ -2,10 +2,16 @@
 
 from __future__ import annotations
 
+import asyncio
+import hashlib
 from abc import ABC, abstractmethod
-from typing import Callable, List
+from typing import TYPE_CHECKING, AsyncIterator, Callable, Dict, Optional, Tuple
 
 from agent_framework.config.schema import AgentConfig
+from agent_framework.core.dedup import dedup
+
+if TYPE_CHECKING:
+    from agent_framework.cache.semantic import SemanticCache, Vector
 
 
 class BaseAgent(ABC):
@@ -19,11 +25,62 @@ class BaseAgent(ABC):
     def __init__(self, config: AgentConfig) -> None:
         self.config = config
         self.name = config.name
-        self._tools: List[Callable] = []
+        self._tools: Dict[str, Callable] = {}
+        self._cache: Optional["SemanticCache"] = None
+        self._keep_history = False
+
+    def register_tool(self, fn: Callable, name: Optional[str] = None) -> None:
+        """Attach a callable tool under *name* (defaults to fn.__name__), replacing any previous one."""
+        self._tools[name or fn.__name__] = fn
+
+    def _shared_tool(self, fn: Callable, name: str) -> Callable:
+        """*fn* wrapped in the cross-agent result cache when its ToolConfig sets ``cache_ttl``."""
+        ttl = next((tc.cache_ttl for tc in self.config.tools if tc.name == name), 0)
+        return dedup(fn, ttl=ttl)
+
+    def set_cache(self, cache: Optional["SemanticCache"]) -> None:
+        """Attach a SemanticCache consulted by run() before calling the LLM (None disables)."""
+        self._cache = cache
+
+    def set_keep_history(self, keep: bool) -> None:
+        """
+        Carry client-side conversation history across run() calls (interactive chat).
+
+        Off by default, so servers and pipelines sharing one agent get independent
+        calls. Backends whose history lives in the service (Azure threads) ignore it.
+        """
+        self._keep_history = keep
+
+    @property
+    def cache_namespace(self) -> str:
+        """Cache partition for this agent; changing the instructions invalidates old entries."""
+        digest = hashlib.blake2b(self.config.instructions.encode(), digest_size=16).hexdigest()
+        return f"{self.name}:{self.config.llm.model}:{digest}"
+
+    def _has_conversation(self) -> bool:
+        """True once earlier turns shape the next reply; the semantic cache is then bypassed."""
+        return False
+
+    async def _record_turn(self, message: str, response: str) -> None:
+        """Add an exchange answered from the cache to the conversation state (default: none kept)."""
 
-    def register_tool(self, fn: Callable) -> None:
-        """Attach a callable tool to this agent. Called by ToolRegistry."""
-        self._tools.append(fn)
+    async def _cache_lookup(self, message: str) -> Tuple[Optional[str], Optional["Vector"]]:
+        """
+        Return (cached_response, embedding); both are None when no cache is attached
+        or the agent is mid-conversation. A hit is recorded as a turn of the conversation.
+        """
+        if self._cache is None or self._has_conversation():
+            return None, None
+        # embed_fn is usually a blocking network call
+        embedding = await asyncio.to_thread(self._cache.embed, message)
+        cached = self._cache.lookup(self.cache_namespace, embedding)
+        if cached is not None:
+            await self._record_turn(message, cached)
+        return cached, embedding
+
+    def _cache_store(self, embedding: Optional["Vector"], response: str) -> None:
+        if self._cache is not None and embedding is not None:
+            self._cache.put(self.cache_namespace, embedding, response)
 
     @abstractmethod
     async def run(self, message: str) -> str:
@@ -33,6 +90,22 @@ class BaseAgent(ABC):
         Implementations must be async-safe and return the full reply as a string.
         """
 
+    async def stream(self, message: str) -> AsyncIterator[str]:
+        """
+        Send *message* to the agent and yield its reply in chunks as they arrive.
+
+        The default yields the full run() result once; backends that support
+        token streaming override this.
+        """
+        yield await self.run(message)
+
+    async def warmup(self) -> None:
+        """
+        Prepare for the first run() without sending a prompt (open connections, threads).
+
+        Called speculatively, e.g. while the user is still typing. The default does nothing.
+        """
+
     @abstractmethod
     async def reset(self) -> None:
         """Clear conversation history / thread state so the agent starts fresh."""
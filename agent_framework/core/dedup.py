@@ -0,0 +1,132 @@
+"""
+Cross-agent tool result cache.
+
+    fn = dedup(fn, ttl=60)
+
+The wrapper is shared by every agent that registers the same function, so N
+agents calling ``read_file("a.txt")`` within *ttl* seconds cause one real call.
+Concurrent identical calls to an async tool also coalesce onto a single
+in-flight invocation. Caching is opt-in per tool (``cache_ttl`` in its ToolConfig)
+and only suits pure, read-only tools: every caller receives the same result object.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import inspect
+import threading
+import time
+from collections import OrderedDict
+from functools import wraps
+from typing import Any, Callable, Dict, Hashable, Tuple
+
+_WRAPPERS: Dict[Tuple[Callable, float], Callable] = {}
+_WRAPPERS_LOCK = threading.Lock()
+_MISSING = object()
+
+
+class _TTLCache:
+    """Small LRU cache whose entries expire *ttl* seconds after insertion."""
+
+    def __init__(self, maxsize: int, ttl: float) -> None:
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self._data: "OrderedDict[Hashable, Tuple[float, Any]]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key: Hashable) -> Any:
+        with self._lock:
+            entry = self._data.get(key)
+            if entry is None:
+                return _MISSING
+            expires, value = entry
+            if expires < time.monotonic():
+                del self._data[key]
+                return _MISSING
+            self._data.move_to_end(key)
+            return value
+
+    def set(self, key: Hashable, value: Any) -> None:
+        with self._lock:
+            self._data[key] = (time.monotonic() + self.ttl, value)
+            self._data.move_to_end(key)
+            while len(self._data) > self.maxsize:
+                self._data.popitem(last=False)
+
+
+def _hash_args(args: tuple, kwargs: dict) -> Hashable:
+    key = (args, tuple(sorted(kwargs.items())))
+    try:
+        hash(key)
+        return key
+    except TypeError:  # lists/dicts in the arguments
+        return repr(key)
+
+
+def dedup(fn: Callable, ttl: float = 60.0, maxsize: int = 1024) -> Callable:
+    """Return the shared result-caching wrapper for *fn* (or *fn* itself when ttl <= 0)."""
+    if ttl <= 0:
+        return fn
+    with _WRAPPERS_LOCK:
+        wrapper = _WRAPPERS.get((fn, ttl))
+        if wrapper is None:
+            wrapper = _WRAPPERS[(fn, ttl)] = _make_wrapper(fn, _TTLCache(maxsize, ttl))
+    return wrapper
+
+
+def _resolved_signature(fn: Callable) -> inspect.Signature:
+    """Signature of *fn* with string annotations evaluated in *fn*'s own module."""
+    try:
+        return inspect.signature(fn, eval_str=True)
+    except (NameError, TypeError):  # names only imported under TYPE_CHECKING
+        return inspect.signature(fn)
+
+
+def _make_wrapper(fn: Callable, cache: _TTLCache) -> Callable:
+    # Schema builders (AutoGen, Semantic Kernel) evaluate string annotations against
+    # the wrapper's __globals__, i.e. this module, so hand them resolved ones.
+    signature = _resolved_signature(fn)
+
+    if inspect.iscoroutinefunction(fn):
+        inflight: Dict[Hashable, asyncio.Future] = {}
+
+        @wraps(fn)
+        async def async_wrapper(*args, **kwargs):
+            key = _hash_args(args, kwargs)
+            value = cache.get(key)
+            if value is not _MISSING:
+                return value
+            pending = inflight.get(key)
+            if pending is not None:
+                return await asyncio.shield(pending)
+
+            pending = inflight[key] = asyncio.get_running_loop().create_future()
+            try:
+                value = await fn(*args, **kwargs)
+            except Exception as exc:
+                pending.set_exception(exc)
+                pending.exception()  # mark retrieved when nobody else was waiting
+                raise
+            except BaseException:
+                pending.cancel()
+                raise
+            finally:
+                inflight.pop(key, None)
+            cache.set(key, value)
+            pending.set_result(value)
+            return value
+
+        async_wrapper.__signature__ = signature
+        return async_wrapper
+
+    @wraps(fn)
+    def wrapper(*args, **kwargs):
+        key = _hash_args(args, kwargs)
+        value = cache.get(key)
+        if value is _MISSING:
+            value = fn(*args, **kwargs)
+            cache.set(key, value)
+        return value
+
+    wrapper.__signature__ = signature
+    return wrapper
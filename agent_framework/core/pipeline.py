@@ -9,7 +9,8 @@ Supports three strategies:
 
 from __future__ import annotations
 
-from typing import Dict, List
+import asyncio
+from typing import Dict, FrozenSet, List, Tuple
 
 from agent_framework.config.schema import PipelineConfig
 from agent_framework.core.base_agent import BaseAgent
@@ -19,22 +20,40 @@ logger = get_logger(__name__)
 
 
 class Pipeline:
+    # Strategy name → runner method, resolved once per pipeline in __init__.
+    _STRATEGIES = {
+        "sequential": "_run_sequential",
+        "group_chat": "_run_group_chat",
+        "supervisor": "_run_supervisor",
+    }
+
     def __init__(self, config: PipelineConfig, agents: Dict[str, BaseAgent]) -> None:
         self.config = config
         self.name = config.name
         self.agents = agents
+        try:
+            self._runner = getattr(self, self._STRATEGIES[config.strategy])
+        except KeyError:
+            raise ValueError(f"Unknown strategy: {config.strategy}") from None
         self._ordered: List[BaseAgent] = [agents[n] for n in config.agents]
 
+        # The specialist set is fixed, so the supervisor's routing prompt is built
+        # once around the task. Concatenation rather than str.format: instructions
+        # may contain braces.
+        self._specialists: Dict[str, BaseAgent] = {
+            n: a for n, a in agents.items() if n != config.supervisor_agent
+        }
+        self._specialist_names: FrozenSet[str] = frozenset(self._specialists)
+        self._specialist_order: Tuple[str, ...] = tuple(self._specialists)
+        specialist_info = "\n".join(
+            f"- {name}: {a.config.instructions[:100]}" for name, a in self._specialists.items()
+        )
+        self._routing_prefix = f"You are a supervisor. Available specialists:\n{specialist_info}\n\nTask: "
+        self._routing_suffix = "\n\nReply with ONLY the name of the specialist that should handle this task."
+
     async def run(self, task: str) -> str:
         logger.info("pipeline_start", pipeline=self.name, strategy=self.config.strategy, task=task[:80])
-        if self.config.strategy == "sequential":
-            result = await self._run_sequential(task)
-        elif self.config.strategy == "group_chat":
-            result = await self._run_group_chat(task)
-        elif self.config.strategy == "supervisor":
-            result = await self._run_supervisor(task)
-        else:
-            raise ValueError(f"Unknown strategy: {self.config.strategy}")
+        result = await self._runner(task)
         logger.info("pipeline_done", pipeline=self.name)
         return result
 
@@ -56,10 +75,17 @@ class Pipeline:
         if autogen_agents:
             return await run_group_chat(autogen_agents, task, max_rounds=self.config.max_rounds)
 
-        # Fallback: broadcast task to all agents, concatenate responses
+        # Fallback: broadcast task to all agents concurrently, concatenate responses
+        # in pipeline order. A failing agent contributes an error entry instead of
+        # discarding the others' answers.
+        results = await asyncio.gather(*(a.run(task) for a in self._ordered), return_exceptions=True)
         responses = []
-        for agent in self._ordered:
-            resp = await agent.run(task)
+        for agent, resp in zip(self._ordered, results):
+            if isinstance(resp, Exception):
+                logger.warning("group_chat_agent_failed", agent=agent.name, error=str(resp))
+                resp = f"<error: {resp}>"
+            elif isinstance(resp, BaseException):  # cancellation, KeyboardInterrupt
+                raise resp
             responses.append(f"[{agent.name}]: {resp}")
         return "\n\n".join(responses)
 
@@ -72,23 +98,15 @@ class Pipeline:
             raise ValueError("supervisor_agent not set in pipeline config")
 
         supervisor = self.agents[self.config.supervisor_agent]
-        specialists = {n: a for n, a in self.agents.items() if n != self.config.supervisor_agent}
-
-        specialist_info = "\n".join(
-            f"- {name}: {a.config.instructions[:100]}" for name, a in specialists.items()
-        )
-        routing_prompt = (
-            f"You are a supervisor. Available specialists:\n{specialist_info}\n\n"
-            f"Task: {task}\n\n"
-            f"Reply with ONLY the name of the specialist that should handle this task."
-        )
+        routing_prompt = self._routing_prefix + task + self._routing_suffix
 
         chosen_name = (await supervisor.run(routing_prompt)).strip()
         logger.info("supervisor_routing", chosen=chosen_name)
 
-        if chosen_name not in specialists:
+        if chosen_name not in self._specialist_names:
             # If supervisor gave a bad name, fall back to first specialist
-            logger.warning("supervisor_bad_routing", chosen=chosen_name, fallback=list(specialists)[0])
-            chosen_name = list(specialists)[0]
+            fallback = self._specialist_order[0]
+            logger.warning("supervisor_bad_routing", chosen=chosen_name, fallback=fallback)
+            chosen_name = fallback
 
-        return await specialists[chosen_name].run(task)
+        return await self._specialists[chosen_name].run(task)
@@ -15,7 +15,9 @@ from __future__ import annotations
 
 import importlib
 import inspect
-from typing import Callable, Dict, List, Optional
+import sys
+from types import ModuleType
+from typing import Callable, Dict, List, Optional, Tuple
 
 from agent_framework.config.schema import AgentConfig, ToolConfig
 from agent_framework.observability.logger import get_logger
@@ -44,20 +46,26 @@ class ToolRegistry:
 
     def __init__(self) -> None:
         self._tools: Dict[str, Callable] = {}
+        self._all: Optional[Tuple[Callable, ...]] = None
 
     def register(self, fn: Callable, name: Optional[str] = None) -> None:
         """Register *fn* under *name* (defaults to fn.__name__)."""
         tool_name = name or fn.__name__
         self._tools[tool_name] = fn
+        self._all = None
         logger.debug("tool_registered", name=tool_name)
 
     def get(self, name: str) -> Callable:
-        if name not in self._tools:
-            raise KeyError(f"Tool '{name}' not found in registry. Registered: {list(self._tools)}")
-        return self._tools[name]
+        try:
+            return self._tools[name]
+        except KeyError:
+            raise KeyError(f"Tool '{name}' not found in registry. Registered: {list(self._tools)}") from None
 
-    def all(self) -> List[Callable]:
-        return list(self._tools.values())
+    def all(self) -> Tuple[Callable, ...]:
+        """All registered tools, in registration order (cached until the next register())."""
+        if self._all is None:
+            self._all = tuple(self._tools.values())
+        return self._all
 
     def load_from_config(self, tool_configs: List[ToolConfig]) -> None:
         """
@@ -67,8 +75,14 @@ class ToolRegistry:
             module: "tools.web_search"
             function: "search_web"
         """
+        # Tools often share a module; import each one once, skipping the import
+        # machinery entirely when it is already loaded. Tools are still registered
+        # in config order so later entries override earlier ones as before.
+        modules: Dict[str, ModuleType] = {}
         for tc in tool_configs:
-            mod = importlib.import_module(tc.module)
+            mod = modules.get(tc.module)
+            if mod is None:
+                mod = modules[tc.module] = sys.modules.get(tc.module) or importlib.import_module(tc.module)
             fn = getattr(mod, tc.function)
             if tc.description:
                 fn.__doc__ = tc.description
@@ -76,8 +90,8 @@ class ToolRegistry:
 
     def inject(self, agent: "BaseAgent") -> None:  # noqa: F821
         """Register all tools in this registry onto *agent*."""
-        for fn in self._tools.values():
-            agent.register_tool(fn)
+        for name, fn in self._tools.items():
+            agent.register_tool(fn, name=name)
         logger.debug("tools_injected", agent=agent.name, count=len(self._tools))
 
     @classmethod
@@ -9,16 +9,23 @@ Prerequisites:
 
 from __future__ import annotations
 
-import subprocess
+import asyncio
 import sys
-from pathlib import Path
-from typing import Optional
+from typing import Optional, Tuple
 
+from agent_framework.deploy.env import subprocess_env
 from agent_framework.observability.logger import get_logger
 
 logger = get_logger(__name__)
 
 
+class _AzCommandFailed(Exception):
+    def __init__(self, cmd: str, returncode: int) -> None:
+        super().__init__(cmd)
+        self.cmd = cmd
+        self.returncode = returncode
+
+
 class AzureDeployer:
     def __init__(
         self,
@@ -36,35 +43,54 @@ class AzureDeployer:
         self._cfg = load_agent_config(config_path)
         self.app_name = self._cfg.name.lower().replace(" ", "-").replace("_", "-")
         self.image_name = f"{self.app_name}:latest"
+        self._env_name = f"{self.app_name}-env"
 
     def deploy(self) -> None:
-        self._ensure_resource_group()
-        self._build_and_push_image()
-        self._deploy_container_app()
-
-    def _run_az(self, *args: str, check: bool = True) -> subprocess.CompletedProcess:
+        try:
+            asyncio.run(self._deploy_async())
+        except _AzCommandFailed as exc:
+            print(f"az command failed: {exc.cmd}", file=sys.stderr)
+            sys.exit(exc.returncode)
+
+    async def _deploy_async(self) -> None:
+        await self._ensure_resource_group()
+        # The Container Apps environment and the image build only need the
+        # resource group, so the two slowest steps run side by side.
+        await asyncio.gather(self._create_environment(), self._build_and_push_image())
+        await self._deploy_container_app()
+
+    async def _run_az(self, *args: str, check: bool = True, capture: bool = False) -> Tuple[int, str]:
+        """Run an ``az`` command without blocking the loop; returns (returncode, stdout if captured)."""
         cmd = ["az", *args]
         if self.subscription_id:
             cmd += ["--subscription", self.subscription_id]
         logger.debug("az_command", cmd=" ".join(cmd))
-        result = subprocess.run(cmd, capture_output=False)
-        if check and result.returncode != 0:
-            print(f"az command failed: {' '.join(cmd)}", file=sys.stderr)
-            sys.exit(result.returncode)
-        return result
-
-    def _ensure_resource_group(self) -> None:
+        proc = await asyncio.create_subprocess_exec(
+            *cmd,
+            stdout=asyncio.subprocess.PIPE if capture else None,
+            env=subprocess_env(),
+        )
+        try:
+            stdout, _ = await proc.communicate()
+        except asyncio.CancelledError:
+            proc.kill()  # a sibling step failed; don't leave az running
+            raise
+        if check and proc.returncode != 0:
+            raise _AzCommandFailed(" ".join(cmd), proc.returncode)
+        return proc.returncode, stdout.decode() if stdout else ""
+
+    async def _ensure_resource_group(self) -> None:
         print(f"Ensuring resource group '{self.resource_group}' in '{self.location}'...")
-        self._run_az(
+        await self._run_az(
             "group", "create",
             "--name", self.resource_group,
             "--location", self.location,
         )
 
-    def _build_and_push_image(self) -> None:
+    async def _build_and_push_image(self) -> None:
         acr_name = f"{self.app_name.replace('-', '')}acr"
         print(f"Creating Azure Container Registry '{acr_name}'...")
-        self._run_az(
+        await self._run_az(
             "acr", "create",
             "--resource-group", self.resource_group,
             "--name", acr_name,
@@ -74,7 +100,7 @@ class AzureDeployer:
 
         # Build image using ACR Tasks (no local Docker required)
         print(f"Building image '{self.image_name}' via ACR Tasks...")
-        self._run_az(
+        await self._run_az(
             "acr", "build",
             "--registry", acr_name,
             "--image", self.image_name,
@@ -84,23 +110,22 @@ class AzureDeployer:
         self._acr_name = acr_name
         self._full_image = f"{acr_name}.azurecr.io/{self.image_name}"
 
-    def _deploy_container_app(self) -> None:
-        env_name = f"{self.app_name}-env"
-
-        print(f"Creating Container Apps environment '{env_name}'...")
-        self._run_az(
+    async def _create_environment(self) -> None:
+        print(f"Creating Container Apps environment '{self._env_name}'...")
+        await self._run_az(
             "containerapp", "env", "create",
-            "--name", env_name,
+            "--name", self._env_name,
             "--resource-group", self.resource_group,
             "--location", self.location,
         )
 
+    async def _deploy_container_app(self) -> None:
         print(f"Deploying Container App '{self.app_name}'...")
-        self._run_az(
+        await self._run_az(
             "containerapp", "create",
             "--name", self.app_name,
             "--resource-group", self.resource_group,
-            "--environment", env_name,
+            "--environment", self._env_name,
             "--image", self._full_image,
             "--registry-server", f"{self._acr_name}.azurecr.io",
             "--target-port", "8080",
@@ -110,17 +135,16 @@ class AzureDeployer:
         )
 
         # Print the FQDN
-        result = subprocess.run(
-            [
-                "az", "containerapp", "show",
-                "--name", self.app_name,
-                "--resource-group", self.resource_group,
-                "--query", "properties.configuration.ingress.fqdn",
-                "--output", "tsv",
-            ],
-            capture_output=True, text=True,
+        _, stdout = await self._run_az(
+            "containerapp", "show",
+            "--name", self.app_name,
+            "--resource-group", self.resource_group,
+            "--query", "properties.configuration.ingress.fqdn",
+            "--output", "tsv",
+            check=False,
+            capture=True,
         )
-        fqdn = result.stdout.strip()
+        fqdn = stdout.strip()
         if fqdn:
             print(f"\nAgent deployed! Endpoint: https://{fqdn}/run")
         else:
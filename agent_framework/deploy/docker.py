@@ -8,6 +8,7 @@ import subprocess
 import sys
 from pathlib import Path
 
+from agent_framework.deploy.env import subprocess_env
 from agent_framework.observability.logger import get_logger
 
 logger = get_logger(__name__)
@@ -86,6 +87,7 @@ class DockerDeployer:
         result = subprocess.run(
             ["docker", "build", "-t", self.image_name, "."],
             capture_output=False,
+            env=subprocess_env(),
         )
         if result.returncode != 0:
             print("Docker build failed.", file=sys.stderr)
@@ -99,5 +101,6 @@ class DockerDeployer:
                 "-p", f"{self.port}:{self.port}",
                 "--env-file", ".env",
                 self.image_name,
-            ]
+            ],
+            env=subprocess_env(),
         )
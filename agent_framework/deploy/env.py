@@ -0,0 +1,39 @@
+"""
+Trimmed environment for the ``az`` and ``docker`` subprocesses the deployers spawn.
+
+Only the variables those CLIs read are passed on, instead of copying the whole
+parent environment into every exec. Set ``AGENT_DEPLOY_FULL_ENV=1`` to pass the
+full environment through (e.g. for az extensions that need custom variables).
+"""
+
+from __future__ import annotations
+
+import os
+from functools import lru_cache
+from typing import Dict, Optional
+
+_KEEP = (
+    "PATH", "HOME", "USER", "LOGNAME", "SHELL", "LANG", "LC_ALL", "TMPDIR", "XDG_RUNTIME_DIR",
+    "HTTP_PROXY", "HTTPS_PROXY", "NO_PROXY", "http_proxy", "https_proxy", "no_proxy",
+    "REQUESTS_CA_BUNDLE", "SSL_CERT_FILE",
+    # Windows: needed to even start a process, and where az/docker keep their state
+    "SYSTEMROOT", "COMSPEC", "PATHEXT", "USERPROFILE", "APPDATA", "LOCALAPPDATA", "TEMP", "TMP",
+)
+# az reads its config dir, extensions and service-principal credentials from AZURE_*;
+# docker its daemon, context and BuildKit settings from DOCKER_* / BUILDKIT_*.
+_KEEP_PREFIXES = ("AZURE_", "DOCKER_", "BUILDKIT_")
+
+
+@lru_cache(maxsize=None)
+def _minimal_env() -> Dict[str, str]:
+    return {
+        k: v for k, v in os.environ.items()
+        if k in _KEEP or k.upper() in _KEEP or k.startswith(_KEEP_PREFIXES)
+    }
+
+
+def subprocess_env() -> Optional[Dict[str, str]]:
+    """The ``env=`` argument for deploy subprocesses (None inherits everything)."""
+    if os.environ.get("AGENT_DEPLOY_FULL_ENV"):
+        return None
+    return _minimal_env()
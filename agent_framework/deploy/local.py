@@ -1,22 +1,135 @@
 """
-Local deployment — run the agent as a lightweight HTTP server using the stdlib.
+Local deployment — run the agent as a lightweight HTTP server.
 
 Exposes:
   POST /run    body: {"message": "..."} → {"response": "..."}
   GET  /health → {"status": "ok", "agent": "<name>"}
+
+Served by uvicorn when it is installed (``pip install 'ms-ai-agent-framework[server]'``),
+otherwise by the stdlib http.server. Connections are handled concurrently, but
+/run calls on the agent are serialised because it holds conversation state.
 """
 
 from __future__ import annotations
 
 import asyncio
 import json
-from http.server import BaseHTTPRequestHandler, HTTPServer
-from pathlib import Path
+import queue
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Any, Awaitable, Callable, Dict
 
 from agent_framework.observability.logger import get_logger
 
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
 logger = get_logger(__name__)
 
+_JSON_HEADERS = [(b"content-type", b"application/json")]
+
+
+# Reusable request-body buffers for the stdlib server. ThreadingHTTPServer starts a
+# thread per connection, so buffers are pooled rather than kept thread-local.
+_BODY_BUFFER_SIZE = 65536
+_BODY_BUFFERS: "queue.SimpleQueue[bytearray]" = queue.SimpleQueue()
+
+
+def _json_loads(data: Any) -> Any:
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(bytes(data) if isinstance(data, memoryview) else data)
+
+
+def _read_json_body(rfile, length: int) -> Any:
+    """Parse a JSON request body of *length* bytes, reading small bodies into a pooled buffer."""
+    if length > _BODY_BUFFER_SIZE:
+        return _json_loads(rfile.read(length))
+    try:
+        buf = _BODY_BUFFERS.get_nowait()
+    except queue.Empty:
+        buf = bytearray(_BODY_BUFFER_SIZE)
+    try:
+        with memoryview(buf) as view:
+            filled = 0
+            while filled < length:
+                n = rfile.readinto(view[filled:length])
+                if not n:
+                    break  # client closed early; parse what arrived
+                filled += n
+            return _json_loads(view[:filled])
+    finally:
+        _BODY_BUFFERS.put(buf)
+
+
+def _json_dumps(payload: Any) -> bytes:
+    return orjson.dumps(payload) if orjson is not None else json.dumps(payload).encode()
+
+
+def _serialized_run(agent) -> Callable[[str], Awaitable[str]]:
+    """
+    ``agent.run`` behind a lock, one request at a time.
+
+    An agent instance carries conversation state (its Azure thread, AutoGen's
+    chat messages), so overlapping requests would interleave on it.
+    """
+    lock = asyncio.Lock()
+
+    async def run(message: str) -> str:
+        async with lock:
+            return await agent.run(message)
+
+    return run
+
+
+def make_asgi_app(agent) -> Callable[..., Awaitable[None]]:
+    """ASGI application serving /run and /health for *agent*."""
+    run = _serialized_run(agent)
+
+    async def app(scope: Dict[str, Any], receive, send) -> None:
+        if scope["type"] == "lifespan":
+            while True:
+                event = await receive()
+                if event["type"] == "lifespan.startup":
+                    await send({"type": "lifespan.startup.complete"})
+                elif event["type"] == "lifespan.shutdown":
+                    await send({"type": "lifespan.shutdown.complete"})
+                    return
+        if scope["type"] != "http":
+            return
+
+        if scope["method"] == "GET" and scope["path"] == "/health":
+            code, payload = 200, {"status": "ok", "agent": agent.name}
+        elif scope["method"] == "POST" and scope["path"] == "/run":
+            body = _json_loads(await _read_body(receive))
+            code, payload = 200, {"response": await run(body.get("message", ""))}
+        else:
+            code, payload = 404, {"error": "not found"}
+
+        data = _json_dumps(payload)
+        await send({
+            "type": "http.response.start",
+            "status": code,
+            "headers": [*_JSON_HEADERS, (b"content-length", str(len(data)).encode())],
+        })
+        await send({"type": "http.response.body", "body": data})
+
+    return app
+
+
+async def _read_body(receive) -> bytes:
+    event = await receive()
+    body = event.get("body", b"")
+    if not event.get("more_body"):
+        return body
+    chunks = [body]
+    while event.get("more_body"):
+        event = await receive()
+        chunks.append(event.get("body", b""))
+    return b"".join(chunks)
+
 
 class LocalDeployer:
     def __init__(self, config_path: str, port: int = 8080) -> None:
@@ -34,6 +147,31 @@ class LocalDeployer:
 
         logger.info("local_deploy_start", agent=agent.name, port=self.port)
 
+        try:
+            import uvicorn
+        except ImportError:
+            self._serve_stdlib(agent)
+            return
+
+        self._print_banner(agent)
+        uvicorn.run(make_asgi_app(agent), host="0.0.0.0", port=self.port, log_level="warning")
+        print("\nStopped.")
+
+    def _print_banner(self, agent) -> None:
+        print(f"Agent '{agent.name}' listening on http://0.0.0.0:{self.port}")
+        print("  POST /run    {\"message\": \"...\"}")
+        print("  GET  /health")
+        print("Press Ctrl+C to stop.")
+
+    def _serve_stdlib(self, agent) -> None:
+        # Requests are handled on server threads but all share one event loop, so
+        # the agent's async clients live on a single loop for the whole process;
+        # the lock there keeps overlapping requests from interleaving on the agent.
+        loop = asyncio.new_event_loop()
+        loop_thread = threading.Thread(target=loop.run_forever, name="agent-loop", daemon=True)
+        loop_thread.start()
+        run = _serialized_run(agent)
+
         class Handler(BaseHTTPRequestHandler):
             def log_message(self, fmt, *args):  # silence default access log
                 pass
@@ -49,25 +187,27 @@ class LocalDeployer:
                     self._json(404, {"error": "not found"})
                     return
                 length = int(self.headers.get("Content-Length", 0))
-                body = json.loads(self.rfile.read(length))
+                body = _read_json_body(self.rfile, length)
                 message = body.get("message", "")
-                response = asyncio.run(agent.run(message))
+                response = asyncio.run_coroutine_threadsafe(run(message), loop).result()
                 self._json(200, {"response": response})
 
             def _json(self, code: int, payload: dict) -> None:
-                data = json.dumps(payload).encode()
+                data = _json_dumps(payload)
                 self.send_response(code)
                 self.send_header("Content-Type", "application/json")
                 self.send_header("Content-Length", str(len(data)))
                 self.end_headers()
                 self.wfile.write(data)
 
-        server = HTTPServer(("0.0.0.0", self.port), Handler)
-        print(f"Agent '{agent.name}' listening on http://0.0.0.0:{self.port}")
-        print("  POST /run    {\"message\": \"...\"}")
-        print("  GET  /health")
-        print("Press Ctrl+C to stop.")
+        server = ThreadingHTTPServer(("0.0.0.0", self.port), Handler)
+        self._print_banner(agent)
         try:
             server.serve_forever()
         except KeyboardInterrupt:
             print("\nStopped.")
+        finally:
+            server.server_close()
+            loop.call_soon_threadsafe(loop.stop)
+            loop_thread.join()
+            loop.close()
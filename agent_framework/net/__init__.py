@@ -0,0 +1,3 @@
+from .http import get_shared_async_client, get_shared_client, get_shared_azure_transport
+
+__all__ = ["get_shared_async_client", "get_shared_client", "get_shared_azure_transport"]
@@ -0,0 +1,83 @@
+"""
+Shared HTTP clients with tuned connection-pool limits.
+
+Backends inject these into every SDK client that accepts one, so concurrent
+agent runs share a large keep-alive pool per endpoint instead of each SDK's
+small per-host default.
+
+Retries are left to the SDKs: the OpenAI client and azure-core's RetryPolicy
+both already back off on 429/503 and honour ``Retry-After``.
+
+The async client is created on first use and, like any httpx.AsyncClient, must
+be used from a single event loop — the CLI runs each session on one loop.
+"""
+
+from __future__ import annotations
+
+import importlib.util
+from functools import lru_cache
+
+MAX_CONNECTIONS = 200
+MAX_KEEPALIVE_CONNECTIONS = 100
+TIMEOUT_SECONDS = 60.0
+
+
+def _httpx():
+    try:
+        import httpx
+    except ImportError:
+        raise ImportError("httpx is required for shared HTTP clients: pip install httpx")
+    return httpx
+
+
+def _http2_available() -> bool:
+    return importlib.util.find_spec("h2") is not None
+
+
+def _limits():
+    return _httpx().Limits(
+        max_connections=MAX_CONNECTIONS,
+        max_keepalive_connections=MAX_KEEPALIVE_CONNECTIONS,
+    )
+
+
+@lru_cache(maxsize=None)
+def get_shared_async_client():
+    """Process-wide httpx.AsyncClient (HTTP/2 when the ``h2`` package is installed)."""
+    return _httpx().AsyncClient(limits=_limits(), http2=_http2_available(), timeout=TIMEOUT_SECONDS)
+
+
+@lru_cache(maxsize=None)
+def _shared_client_cls():
+    class SharedClient(_httpx().Client):
+        """httpx.Client that deep-copies to itself, so it can sit inside copied SDK configs."""
+
+        def __deepcopy__(self, memo):
+            return self
+
+    return SharedClient
+
+
+@lru_cache(maxsize=None)
+def get_shared_client():
+    """
+    Process-wide synchronous httpx.Client, for SDKs that make blocking calls.
+
+    ``copy.deepcopy`` returns the client itself: AutoGen deep-copies ``llm_config``
+    and requires every value in it to support that.
+    """
+    return _shared_client_cls()(limits=_limits(), http2=_http2_available(), timeout=TIMEOUT_SECONDS)
+
+
+@lru_cache(maxsize=None)
+def get_shared_azure_transport():
+    """azure-core transport over one pooled requests.Session, for Azure SDK clients."""
+    import requests
+    from azure.core.pipeline.transport import RequestsTransport
+    from requests.adapters import HTTPAdapter
+
+    session = requests.Session()
+    adapter = HTTPAdapter(pool_connections=MAX_KEEPALIVE_CONNECTIONS, pool_maxsize=MAX_CONNECTIONS)
+    session.mount("https://", adapter)
+    session.mount("http://", adapter)
+    return RequestsTransport(session=session, session_owner=False)
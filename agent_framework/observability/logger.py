@@ -5,6 +5,9 @@ Usage:
     from agent_framework.observability.logger import get_logger
     logger = get_logger(__name__)
     logger.info("agent_run", agent="my-agent", tokens=120)
+
+Set AGENT_LOG=1 for structured info logs (AGENT_DEBUG=1 adds debug); otherwise
+only warnings and errors are printed.
 """
 
 from __future__ import annotations
@@ -12,11 +15,55 @@ from __future__ import annotations
 import logging
 import os
 import sys
-from typing import Optional
+from typing import Dict, Optional
+
+# structlog is only imported and configured when logging is switched on with
+# AGENT_LOG or AGENT_DEBUG; one-shot CLI commands otherwise skip it entirely.
+_configured = False
+_QUIET: Dict[str, "_QuietLogger"] = {}
+
+
+def _logging_enabled() -> bool:
+    return bool(os.environ.get("AGENT_LOG") or os.environ.get("AGENT_DEBUG"))
+
+
+class _QuietLogger:
+    """
+    Stand-in for a structlog logger while logging is off.
+
+    debug/info events are dropped; warnings and errors still reach stderr through
+    stdlib logging's last-resort handler, so failures are never silent.
+    """
+
+    __slots__ = ("_std",)
 
-try:
-    import structlog
+    def __init__(self, name: str) -> None:
+        self._std = logging.getLogger(name)
 
+    def _emit(self, level: int, event: str, kw: dict) -> None:
+        if kw:
+            event = f"{event} " + " ".join(f"{k}={v!r}" for k, v in kw.items())
+        self._std.log(level, event)
+
+    def debug(self, event: str, **kw) -> None:
+        pass
+
+    info = debug
+
+    def warning(self, event: str, **kw) -> None:
+        self._emit(logging.WARNING, event, kw)
+
+    def error(self, event: str, **kw) -> None:
+        self._emit(logging.ERROR, event, kw)
+
+    def exception(self, event: str, **kw) -> None:
+        self._emit(logging.ERROR, event, kw)
+
+    def bind(self, **kw) -> "_QuietLogger":
+        return self
+
+
+def _configure_structlog(structlog) -> None:
     structlog.configure(
         processors=[
             structlog.contextvars.merge_contextvars,
@@ -31,13 +78,23 @@ try:
         logger_factory=structlog.PrintLoggerFactory(),
     )
 
-    def get_logger(name: str):
-        return structlog.get_logger(name)
 
-except ImportError:
-    # Fallback to stdlib logging when structlog isn't installed
-    def get_logger(name: str):  # type: ignore[misc]
+def get_logger(name: str):
+    global _configured
+    if not _logging_enabled():
+        logger = _QUIET.get(name)
+        if logger is None:
+            logger = _QUIET[name] = _QuietLogger(name)
+        return logger
+    try:
+        import structlog
+    except ImportError:
+        # Fallback to stdlib logging when structlog isn't installed
         return logging.getLogger(name)
+    if not _configured:
+        _configure_structlog(structlog)
+        _configured = True
+    return structlog.get_logger(name)
 
 
 def setup_telemetry(service_name: str = "ms-ai-agent-framework", endpoint: Optional[str] = None) -> None:
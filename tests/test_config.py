@@ -109,3 +109,34 @@ def test_load_pipeline_config(tmp_path: Path):
     cfg = load_pipeline_config(f)
     assert cfg.name == "my-pipeline"
     assert cfg.strategy == "sequential"
+
+
+@pytest.mark.parametrize("text", [
+    "a: 1\nb: \"2\"\nc: [1.5, yes, null, 0x1f, 2001-12-14]\nd: {e: {f: []}}\n",
+    "base: &b {x: 1}\nother:\n  <<: *b\n  y: 2\n",
+    "- !!str 1\n",
+    "",
+])
+def test_load_yaml_matches_safe_load(text):
+    import yaml as _yaml
+    from agent_framework.config.yaml_reader import load_yaml
+    assert load_yaml(text.encode()) == _yaml.safe_load(text)
+
+
+def test_load_agent_config_cached_until_file_changes(tmp_path: Path):
+    f = tmp_path / "agent.yaml"
+    f.write_text("name: first\nbackend: autogen\ninstructions: x\n")
+    cfg = load_agent_config(f)
+    assert load_agent_config(f) is cfg
+    f.write_text("name: second\nbackend: autogen\ninstructions: x\n")
+    assert load_agent_config(f).name == "second"
+
+
+def test_load_large_config_files(tmp_path: Path):
+    # Files above the mmap threshold are parsed from a mapped buffer.
+    import json
+    instructions = "x" * 8192
+    (tmp_path / "agent.json").write_text(json.dumps({"name": "big", "backend": "autogen", "instructions": instructions}))
+    (tmp_path / "agent.yaml").write_text(f"llm: &llm {{model: gpt-4o}}\nname: big\nbackend: autogen\ninstructions: {instructions}\n")
+    assert load_agent_config(tmp_path / "agent.json").instructions == instructions
+    assert load_agent_config(tmp_path / "agent.yaml").llm.model == "gpt-4o"
@@ -0,0 +1,104 @@
+"""Tests for the cross-agent tool result cache."""
+
+from __future__ import annotations
+
+import asyncio
+from typing import List
+
+import pytest
+
+from agent_framework.config.schema import AgentConfig, ToolConfig
+from agent_framework.core.base_agent import BaseAgent
+from agent_framework.core.dedup import dedup
+
+
+def test_identical_calls_run_once_and_wrapper_is_shared():
+    calls = []
+
+    def read_file(path: str) -> str:
+        """Read a file."""
+        calls.append(path)
+        return f"contents of {path}"
+
+    first, second = dedup(read_file), dedup(read_file)
+    assert first is second
+    assert first.__name__ == "read_file" and first.__doc__ == "Read a file."
+
+    assert first("a.txt") == second("a.txt") == "contents of a.txt"
+    first("b.txt")
+    assert calls == ["a.txt", "b.txt"]
+
+
+def test_unhashable_args_are_supported():
+    calls = []
+
+    def crawl(urls):
+        calls.append(list(urls))
+        return len(urls)
+
+    wrapped = dedup(crawl)
+    assert wrapped(["x", "y"]) == wrapped(["x", "y"]) == 2
+    assert len(calls) == 1
+
+
+def test_zero_ttl_disables():
+    def tool():
+        return 1
+
+    assert dedup(tool, ttl=0) is tool
+
+
+@pytest.mark.asyncio
+async def test_concurrent_async_calls_coalesce():
+    calls = []
+
+    async def search(query: str) -> str:
+        calls.append(query)
+        await asyncio.sleep(0.01)
+        return f"results for {query}"
+
+    wrapped = dedup(search)
+    results = await asyncio.gather(*(wrapped("python") for _ in range(5)))
+    assert results == ["results for python"] * 5
+    assert calls == ["python"]
+
+
+def test_tools_are_only_cached_when_their_config_opts_in():
+    class _Agent(BaseAgent):
+        async def run(self, message: str) -> str:
+            return message
+
+        async def reset(self) -> None:
+            pass
+
+    def send_message(text: str) -> str:
+        return text
+
+    def lookup(key: str) -> str:
+        return key
+
+    agent = _Agent(AgentConfig(
+        name="a",
+        backend="autogen",
+        instructions="x",
+        tools=[
+            ToolConfig(name="send", module="m", function="send_message"),
+            ToolConfig(name="lookup", module="m", function="lookup", cache_ttl=30),
+        ],
+    ))
+    assert agent._shared_tool(send_message, "send") is send_message
+    assert agent._shared_tool(lookup, "lookup") is dedup(lookup, ttl=30)
+    assert agent._shared_tool(lookup, "unconfigured") is lookup
+
+
+def test_wrapper_exposes_resolved_annotations_to_autogen():
+    function_utils = pytest.importorskip("autogen.function_utils")
+
+    def crawl(urls: List[str], max_pages: int = 5) -> str:
+        """Crawl pages."""
+        return ""
+
+    schema = function_utils.get_function_schema(dedup(crawl), name="crawl", description="Crawl pages.")
+    params = schema["function"]["parameters"]
+    assert params["properties"]["urls"]["type"] == "array"
+    assert params["required"] == ["urls"]
@@ -30,7 +30,11 @@ SAMPLE_HTML = """
 
 def _mock_response(html: str, url: str = "https://example.com"):
     mock = MagicMock()
-    mock.text = html
+    mock.__enter__.return_value = mock
+    mock.headers = {"content-type": "text/html; charset=utf-8"}
+    mock.encoding = "utf-8"
+    body = html.encode("utf-8")
+    mock.iter_content.side_effect = lambda size: (body[i:i + size] for i in range(0, len(body), size))
     mock.raise_for_status = MagicMock()
     return mock
 
@@ -64,6 +68,55 @@ def test_fetch_page_error(mock_session):
     assert result["links"] == []
 
 
+@patch("tools.docs_crawler._SESSION")
+def test_fetch_page_skips_non_html(mock_session):
+    resp = _mock_response("")
+    resp.headers = {"content-type": "application/pdf"}
+    mock_session.get.return_value = resp
+    result = fetch_page("https://example.com/manual.pdf")
+
+    assert "non-HTML" in result["error"]
+    resp.iter_content.assert_not_called()
+
+
+@patch("tools.docs_crawler._MAX_BODY_BYTES", 64)
+@patch("tools.docs_crawler._SESSION")
+def test_fetch_page_caps_body_size(mock_session):
+    mock_session.get.return_value = _mock_response("<title>Big</title>" + "x" * 10_000)
+    result = fetch_page("https://example.com")
+
+    assert result["error"] is None
+    assert result["title"] == "Big"
+    assert len(result["content"]) < 64
+
+
+def test_clean_text_picks_content_per_page():
+    from bs4 import BeautifulSoup
+
+    index = "<body><p>index</p></body>"
+    article_only = "<body><p>chrome</p><article><p>first</p></article></body>"
+    main_and_article = "<body><p>sidebar junk</p><main><p>real content</p><article><p>card</p></article></main></body>"
+    # What earlier pages of the same site looked like never changes the choice
+    assert _clean_text(BeautifulSoup(index, "html.parser")) == "index"
+    assert _clean_text(BeautifulSoup(article_only, "html.parser")) == "first"
+    assert _clean_text(BeautifulSoup(main_and_article, "html.parser")) == "real content\ncard"
+
+
+def test_make_session_falls_back_without_writable_cache_dir(tmp_path, monkeypatch):
+    import requests
+    from tools import docs_crawler
+
+    blocker = tmp_path / "not-a-dir"
+    blocker.write_text("")
+    monkeypatch.setenv("XDG_CACHE_HOME", str(blocker))
+    monkeypatch.delenv("AGENT_CRAWL_CACHE", raising=False)
+    cached_session = MagicMock()
+    with patch.object(docs_crawler, "CachedSession", cached_session):
+        session = docs_crawler._make_session()
+    assert type(session) is requests.Session
+    cached_session.assert_not_called()
+
+
 # ---------------------------------------------------------------------------
 # crawl_docs
 # ---------------------------------------------------------------------------
@@ -178,3 +231,100 @@ def test_summarise_crawl_formats_output():
 def test_summarise_crawl_empty():
     result = summarise_crawl({"pages": [], "skipped": [], "total_fetched": 0})
     assert "No pages" in result
+
+
+@pytest.mark.asyncio
+@patch("tools.docs_crawler.fetch_page")
+async def test_crawl_callable_from_running_loop(mock_fetch):
+    mock_fetch.return_value = {"url": "u", "title": "t", "content": "c", "links": [], "error": None}
+    result = crawl_docs(["https://docs.example.com"], max_depth=0, delay_seconds=0)
+    assert result["total_fetched"] == 1
+
+
+@patch("tools.docs_crawler.fetch_page")
+def test_crawl_queues_each_link_once(mock_fetch):
+    def side_effect(url):
+        links = ["https://docs.example.com/a", "https://docs.example.com/b", "https://docs.example.com"]
+        return {"url": url, "title": url, "content": "c", "links": links, "error": None}
+
+    mock_fetch.side_effect = side_effect
+    result = crawl_docs(["https://docs.example.com"], max_depth=3, max_pages=10, delay_seconds=0)
+
+    assert sorted(p["url"] for p in result["pages"]) == [
+        "https://docs.example.com", "https://docs.example.com/a", "https://docs.example.com/b",
+    ]
+    assert mock_fetch.call_count == 3
+    assert result["skipped"] == []
+
+
+@patch("tools.docs_crawler.fetch_page")
+def test_crawl_runs_concurrency_fetches_at_once(mock_fetch):
+    import threading
+
+    # Every fetch waits until 40 are in flight, more than the default executor allows
+    all_in_flight = threading.Barrier(40, timeout=5)
+
+    def side_effect(url):
+        all_in_flight.wait()
+        return {"url": url, "title": url, "content": "c", "links": [], "error": None}
+
+    mock_fetch.side_effect = side_effect
+    seeds = [f"https://docs{i}.example.com" for i in range(40)]
+    result = crawl_docs(seeds, max_depth=0, max_pages=40, delay_seconds=0, concurrency=40)
+    assert result["total_fetched"] == 40
+
+
+@patch("tools.docs_crawler._fetch_robots")
+@patch("tools.docs_crawler.fetch_page")
+def test_crawl_respects_robots(mock_fetch, mock_robots):
+    from urllib.robotparser import RobotFileParser
+
+    rules = RobotFileParser()
+    rules.parse(["User-agent: *", "Disallow: /private"])
+    mock_robots.return_value = rules
+
+    def side_effect(url):
+        links = ["https://docs.example.com/public", "https://docs.example.com/private/x"]
+        return {"url": url, "title": url, "content": "c", "links": links, "error": None}
+
+    mock_fetch.side_effect = side_effect
+    result = crawl_docs(["https://docs.example.com"], max_depth=1, delay_seconds=0, respect_robots=True)
+
+    assert [p["url"] for p in result["pages"]] == ["https://docs.example.com", "https://docs.example.com/public"]
+    assert result["skipped"] == ["https://docs.example.com/private/x"]
+    mock_robots.assert_called_once_with("https", "docs.example.com")
+
+
+@pytest.mark.parametrize("status, allowed", [(401, False), (403, False), (404, True), (410, True)])
+@patch("tools.docs_crawler._SESSION")
+def test_fetch_robots_error_statuses(mock_session, status, allowed):
+    from tools.docs_crawler import _fetch_robots
+
+    mock_session.get.return_value = MagicMock(status_code=status, text="")
+    rules = _fetch_robots("https", "docs.example.com")
+    assert (rules is None or rules.can_fetch("bot", "https://docs.example.com/page")) is allowed
+
+
+@patch("tools.docs_crawler.fetch_page")
+def test_crawl_visited_db_skips_pages_from_earlier_runs(mock_fetch, tmp_path):
+    def side_effect(url):
+        links = ["https://docs.example.com/a"]
+        return {"url": url, "title": url, "content": "c", "links": links, "error": None}
+
+    mock_fetch.side_effect = side_effect
+    db = str(tmp_path / "visited.bloom")
+    first = crawl_docs(["https://docs.example.com"], max_depth=1, delay_seconds=0, visited_db=db)
+    second = crawl_docs(["https://docs.example.com"], max_depth=1, delay_seconds=0, visited_db=db)
+
+    assert first["total_fetched"] == 2
+    # The seed is re-fetched to find new links; the known subpage is not
+    assert [p["url"] for p in second["pages"]] == ["https://docs.example.com"]
+    assert second["skipped"] == ["https://docs.example.com/a"]
+
+
+def test_crawler_tools_have_autogen_schemas():
+    function_utils = pytest.importorskip("autogen.function_utils")
+
+    for tool in (fetch_page, crawl_docs, summarise_crawl):
+        schema = function_utils.get_function_schema(tool, name=tool.__name__, description="tool")
+        assert schema["function"]["name"] == tool.__name__
@@ -35,7 +35,14 @@ def test_create_azure_agent():
 
 
 def test_unknown_backend_raises():
-    cfg = AgentConfig(name="x", backend="autogen", instructions="x")
-    cfg.backend = "unknown"  # bypass literal validation
+    cfg = AgentConfig.model_construct(name="x", backend="unknown", instructions="x")  # bypass literal validation
     with pytest.raises(ValueError, match="Unknown backend"):
         create_agent(cfg)
+
+
+def test_create_autogen_agent_with_real_autogen(monkeypatch):
+    autogen = pytest.importorskip("autogen")
+    monkeypatch.setenv("OPENAI_API_KEY", "sk-test")
+    cfg = AgentConfig(name="coder", backend="autogen", instructions="x")
+    agent = create_agent(cfg)
+    assert isinstance(agent._assistant, autogen.AssistantAgent)
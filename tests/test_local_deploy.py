@@ -0,0 +1,69 @@
+"""Tests for the local deployment ASGI app."""
+
+import asyncio
+import json
+
+import pytest
+from unittest.mock import AsyncMock, MagicMock
+
+from agent_framework.deploy.local import make_asgi_app
+
+
+async def _call(app, method: str, path: str, body: bytes = b""):
+    sent = []
+    events = iter([{"type": "http.request", "body": body, "more_body": False}])
+
+    async def receive():
+        return next(events)
+
+    async def send(event):
+        sent.append(event)
+
+    await app({"type": "http", "method": method, "path": path}, receive, send)
+    return sent[0]["status"], json.loads(sent[1]["body"])
+
+
+def _agent():
+    agent = MagicMock()
+    agent.name = "test"
+    agent.run = AsyncMock(return_value="hi there")
+    return agent
+
+
+@pytest.mark.asyncio
+async def test_run_endpoint():
+    agent = _agent()
+    status, payload = await _call(make_asgi_app(agent), "POST", "/run", b'{"message": "hello"}')
+    assert status == 200
+    assert payload == {"response": "hi there"}
+    agent.run.assert_awaited_once_with("hello")
+
+
+@pytest.mark.asyncio
+async def test_health_and_not_found():
+    app = make_asgi_app(_agent())
+    assert await _call(app, "GET", "/health") == (200, {"status": "ok", "agent": "test"})
+    assert (await _call(app, "GET", "/run"))[0] == 404
+
+
+@pytest.mark.asyncio
+async def test_concurrent_runs_do_not_overlap():
+    active, peak = 0, 0
+
+    async def run(message):
+        nonlocal active, peak
+        active += 1
+        peak = max(peak, active)
+        await asyncio.sleep(0.01)
+        active -= 1
+        return message
+
+    agent = _agent()
+    agent.run = run
+    app = make_asgi_app(agent)
+    results = await asyncio.gather(
+        _call(app, "POST", "/run", b'{"message": "a"}'),
+        _call(app, "POST", "/run", b'{"message": "b"}'),
+    )
+    assert [payload["response"] for _, payload in results] == ["a", "b"]
+    assert peak == 1
@@ -64,3 +64,42 @@ async def test_supervisor_bad_routing_fallback():
     pipe = Pipeline(cfg, {"supervisor": supervisor, "specialist": spec})
     result = await pipe.run("task")
     assert result == "fallback-result"
+
+
+@pytest.mark.asyncio
+async def test_supervisor_routing_prompt_lists_specialists():
+    supervisor = _make_agent("supervisor", response="specialist")
+    spec = _make_agent("specialist", response="done")
+    spec.config = AgentConfig(name="specialist", backend="autogen", instructions="Handles {braces} fine.")
+
+    cfg = PipelineConfig(
+        name="pipe",
+        agents=["supervisor", "specialist"],
+        strategy="supervisor",
+        supervisor_agent="supervisor",
+    )
+    pipe = Pipeline(cfg, {"supervisor": supervisor, "specialist": spec})
+    await pipe.run("task {x}")
+
+    prompt = supervisor.run.call_args.args[0]
+    assert "- specialist: Handles {braces} fine." in prompt
+    assert "Task: task {x}\n\n" in prompt
+
+
+@pytest.mark.asyncio
+async def test_group_chat_fallback_runs_all_agents():
+    agent_a = _make_agent("a", backend="semantic_kernel", response="from-a")
+    agent_b = _make_agent("b", backend="semantic_kernel")
+    agent_b.run = AsyncMock(side_effect=RuntimeError("boom"))
+
+    cfg = PipelineConfig(name="pipe", agents=["a", "b"], strategy="group_chat")
+    pipe = Pipeline(cfg, {"a": agent_a, "b": agent_b})
+    result = await pipe.run("task")
+
+    assert result == "[a]: from-a\n\n[b]: <error: boom>"
+
+
+def test_unknown_strategy_rejected_at_construction():
+    cfg = PipelineConfig.model_construct(name="pipe", agents=[], strategy="round_robin", supervisor_agent=None)
+    with pytest.raises(ValueError, match="Unknown strategy"):
+        Pipeline(cfg, {})
@@ -0,0 +1,101 @@
+"""Tests for the semantic response cache."""
+
+import pytest
+from unittest.mock import AsyncMock
+
+from agent_framework.cache.semantic import SemanticCache, SQLiteStore
+from agent_framework.config.schema import AgentConfig
+from agent_framework.core.base_agent import BaseAgent
+
+
+_VECTORS = {
+    "what is python?": [1.0, 0.0, 0.0],
+    "what is python ?": [0.99, 0.05, 0.0],
+    "how tall is everest?": [0.0, 1.0, 0.0],
+}
+
+
+def _embed(text: str):
+    return _VECTORS[text]
+
+
+class _EchoAgent(BaseAgent):
+    def __init__(self, config: AgentConfig, stateful: bool = False) -> None:
+        super().__init__(config)
+        self.llm = AsyncMock(side_effect=lambda m: f"answer to {m}")
+        self.stateful = stateful
+        self.history = []
+
+    def _has_conversation(self) -> bool:
+        return self.stateful and bool(self.history)
+
+    async def _record_turn(self, message: str, response: str) -> None:
+        self.history.append((message, response))
+
+    async def run(self, message: str) -> str:
+        cached, embedding = await self._cache_lookup(message)
+        if cached is not None:
+            return cached
+        response = await self.llm(message)
+        self.history.append((message, response))
+        self._cache_store(embedding, response)
+        return response
+
+    async def reset(self) -> None:
+        self.history = []
+
+
+def _agent(instructions: str = "x", stateful: bool = False) -> _EchoAgent:
+    return _EchoAgent(AgentConfig(name="a", backend="autogen", instructions=instructions), stateful)
+
+
+def test_lookup_hits_near_duplicate():
+    cache = SemanticCache(_embed)
+    cache.put("ns", cache.embed("what is python?"), "a language")
+    assert cache.lookup("ns", cache.embed("what is python ?")) == "a language"
+    assert cache.lookup("ns", cache.embed("how tall is everest?")) is None
+    assert cache.lookup("other-ns", cache.embed("what is python?")) is None
+
+
+def test_sqlite_store_roundtrip():
+    cache = SemanticCache(_embed, store=SQLiteStore())
+    cache.put("ns", cache.embed("what is python?"), "a language")
+    assert cache.lookup("ns", cache.embed("what is python?")) == "a language"
+
+
+def test_invalid_threshold_raises():
+    with pytest.raises(ValueError, match="threshold"):
+        SemanticCache(_embed, threshold=1.5)
+
+
+@pytest.mark.asyncio
+async def test_agent_run_served_from_cache():
+    agent = _agent()
+    agent.set_cache(SemanticCache(_embed))
+
+    assert await agent.run("what is python?") == "answer to what is python?"
+    assert await agent.run("what is python ?") == "answer to what is python?"
+    agent.llm.assert_called_once()
+
+
+@pytest.mark.asyncio
+async def test_cache_bypassed_mid_conversation_and_hits_recorded():
+    cache = SemanticCache(_embed)
+    first, second = _agent(stateful=True), _agent(stateful=True)
+    first.set_cache(cache)
+    second.set_cache(cache)
+
+    await first.run("what is python?")
+    await first.run("how tall is everest?")  # follow-up: answered by the LLM, not cached
+    first.llm.reset_mock()
+
+    # A fresh conversation is served from the cache and remembers the exchange...
+    assert await second.run("what is python ?") == "answer to what is python?"
+    assert second.history == [("what is python ?", "answer to what is python?")]
+    # ...after which the follow-up that first asked mid-conversation is not a hit
+    assert await second.run("how tall is everest?") == "answer to how tall is everest?"
+    second.llm.assert_called_once()
+
+
+def test_namespace_changes_with_instructions():
+    assert _agent("one").cache_namespace != _agent("two").cache_namespace
@@ -0,0 +1,64 @@
+"""Tests for the Semantic Kernel backend's conversation history handling."""
+
+import asyncio
+from types import SimpleNamespace
+
+import pytest
+from unittest.mock import patch
+
+from agent_framework.backends import semantic_kernel_backend
+from agent_framework.backends.semantic_kernel_backend import SemanticKernelAgent
+from agent_framework.config.schema import AgentConfig
+
+
+class _History:
+    def __init__(self):
+        self.messages = []
+
+    def add_user_message(self, text):
+        self.messages.append(("user", text))
+
+    def add_assistant_message(self, text):
+        self.messages.append(("assistant", text))
+
+
+class _ChatAgent:
+    """Stands in for ChatCompletionAgent: records what it was sent, fails on 'boom'."""
+
+    def __init__(self):
+        self.sent = []
+
+    async def get_response(self, messages):
+        self.sent.append(list(messages.messages))
+        await asyncio.sleep(0.01)
+        if messages.messages[-1] == ("user", "boom"):
+            raise RuntimeError("boom")
+        return f"reply to {messages.messages[-1][1]}"
+
+
+@pytest.fixture
+def agent():
+    with patch.object(semantic_kernel_backend, "_semantic_kernel", return_value=SimpleNamespace(ChatHistory=_History)):
+        with patch.object(SemanticKernelAgent, "_build"):
+            agent = SemanticKernelAgent(AgentConfig(name="sk", backend="semantic_kernel", instructions="x"))
+        agent._agent = _ChatAgent()
+        yield agent
+
+
+@pytest.mark.asyncio
+async def test_calls_are_independent_by_default(agent):
+    await asyncio.gather(agent.run("a"), agent.run("b"))
+    assert sorted(agent._agent.sent) == [[("user", "a")], [("user", "b")]]
+    assert agent._history is None
+
+
+@pytest.mark.asyncio
+async def test_kept_history_is_serialised_and_drops_failed_turns(agent):
+    agent.set_keep_history(True)
+    await asyncio.gather(agent.run("a"), agent.run("b"))
+    with pytest.raises(RuntimeError):
+        await agent.run("boom")
+    assert agent._history.messages == [
+        ("user", "a"), ("assistant", "reply to a"),
+        ("user", "b"), ("assistant", "reply to b"),
+    ]
@@ -51,4 +51,35 @@ def test_inject_into_agent():
     reg = ToolRegistry()
     reg.register(greet)
     reg.inject(agent)
-    agent.register_tool.assert_called_once_with(greet)
+    agent.register_tool.assert_called_once_with(greet, name="greet")
+
+
+def test_load_from_config_shared_module():
+    from agent_framework.config.schema import ToolConfig
+
+    reg = ToolRegistry()
+    reg.load_from_config([
+        ToolConfig(name="hello", module=__name__, function="greet"),
+        ToolConfig(name="plus", module=__name__, function="add"),
+    ])
+    assert reg.get("hello") is greet
+    assert reg.get("plus")(2, 3) == 5
+
+
+def test_reinject_replaces_agent_tools():
+    from agent_framework.config.schema import AgentConfig
+    from agent_framework.core.base_agent import BaseAgent
+
+    class _Agent(BaseAgent):
+        async def run(self, message: str) -> str:
+            return message
+
+        async def reset(self) -> None:
+            pass
+
+    agent = _Agent(AgentConfig(name="test", backend="autogen", instructions="x"))
+    reg = ToolRegistry()
+    reg.register(greet, name="hello")
+    reg.inject(agent)
+    reg.inject(agent)
+    assert agent._tools == {"hello": greet}
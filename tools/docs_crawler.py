@@ -9,59 +9,159 @@ Tools exposed:
 
 from __future__ import annotations
 
+import asyncio
+import atexit
+import hashlib
+import importlib.util
+import io
+import math
+import multiprocessing
+import os
 import re
+import threading
 import time
-from collections import deque
-from typing import Any, Dict, List, Optional
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from functools import lru_cache
+from pathlib import Path
+from typing import Any, Coroutine, Dict, List, Optional, Tuple
 from urllib.parse import urljoin, urlparse
+from urllib.robotparser import RobotFileParser
+
+# Pydantic (used by AutoGen / SK to build tool schemas) rejects typing.TypedDict
+# before Python 3.12.
+from typing_extensions import TypedDict
 
 from agent_framework.core.tool_registry import register_tool
 
 try:
     import requests
     from bs4 import BeautifulSoup
+    from requests.adapters import HTTPAdapter
 except ImportError:
     raise ImportError("Install crawl dependencies: pip install requests beautifulsoup4")
 
+try:
+    from requests_cache import CachedSession
+except ImportError:
+    CachedSession = None
+
+
+# ---------------------------------------------------------------------------
+# Result shapes (plain dicts at runtime, so they serialise with json/orjson as-is)
+# ---------------------------------------------------------------------------
+
+class PageResult(TypedDict):
+    """Return value of fetch_page()."""
+    url: str
+    title: str
+    content: str
+    links: List[str]
+    error: Optional[str]
+
+
+class PageRecord(TypedDict):
+    """One crawled page in CrawlResult."""
+    url: str
+    title: str
+    content: str
+    depth: int
+
+
+class CrawlResult(TypedDict):
+    """Return value of crawl_docs()."""
+    pages: List[PageRecord]
+    skipped: List[str]
+    total_fetched: int
+
 
 # ---------------------------------------------------------------------------
 # Internal helpers
 # ---------------------------------------------------------------------------
 
-_SESSION = requests.Session()
+def _make_session() -> requests.Session:
+    """
+    HTTP session for the crawler, with an on-disk response cache when requests-cache is installed.
+
+    The cache (``~/.cache/ms-ai-agent-framework/docs_crawler.sqlite``) keeps pages for
+    24h, honours Cache-Control and revalidates expired entries with ETag /
+    If-Modified-Since, so re-crawling unchanged docs costs at most a 304 per page.
+    Set ``AGENT_CRAWL_CACHE=0`` to disable it. Without a writable cache directory
+    (e.g. a read-only or missing HOME in a container) pages are fetched uncached.
+    """
+    if CachedSession is None or os.environ.get("AGENT_CRAWL_CACHE") == "0":
+        return requests.Session()
+    try:
+        cache_dir = Path(os.environ.get("XDG_CACHE_HOME") or Path.home() / ".cache") / "ms-ai-agent-framework"
+        cache_dir.mkdir(parents=True, exist_ok=True)
+    except (OSError, RuntimeError):  # RuntimeError: Path.home() cannot resolve a home directory
+        return requests.Session()
+    return CachedSession(
+        str(cache_dir / "docs_crawler"),
+        backend="sqlite",
+        expire_after=86400,
+        cache_control=True,
+        stale_if_error=True,
+    )
+
+
+_SESSION = _make_session()
 _SESSION.headers.update({
-    "User-Agent": "ms-ai-agent-framework/0.1 (docs-reader)"
+    "User-Agent": "ms-ai-agent-framework/0.1 (docs-reader)",
+    # Ask content-negotiating servers for the HTML representation up front
+    "Accept": "text/html,application/xhtml+xml;q=0.9,*/*;q=0.1",
 })
-
-_SKIP_EXTENSIONS = {
+# Keep-alive pool large enough for every concurrent crawl worker to reuse its own
+# connection to a docs host (requests' default keeps only 10 per host).
+_ADAPTER = HTTPAdapter(pool_connections=16, pool_maxsize=32)
+_SESSION.mount("https://", _ADAPTER)
+_SESSION.mount("http://", _ADAPTER)
+atexit.register(_SESSION.close)
+
+# lxml's C parser when installed (pip install 'ms-ai-agent-framework[fast-crawl]'),
+# else the pure-Python one bundled with the stdlib.
+_HTML_PARSER = "lxml" if importlib.util.find_spec("lxml") is not None else "html.parser"
+
+# A tuple so _skip_url can test every suffix in one str.endswith call.
+_SKIP_EXTENSIONS = (
     ".pdf", ".zip", ".tar", ".gz", ".png", ".jpg", ".jpeg",
     ".gif", ".svg", ".mp4", ".mp3", ".exe", ".dmg",
-}
+)
 
 
-def _same_origin(base: str, url: str) -> bool:
-    """Return True if *url* shares the same scheme+host as *base*."""
-    b, u = urlparse(base), urlparse(url)
-    return b.scheme == u.scheme and b.netloc == u.netloc
+# Each URL is tested several times per crawl (when found, queued and fetched), so
+# the urlparse-based helpers are memoized.
+@lru_cache(maxsize=8192)
+def _origin_key(url: str) -> Tuple[str, str]:
+    """(scheme, netloc) of *url*."""
+    p = urlparse(url)
+    return p.scheme, p.netloc
 
 
+@lru_cache(maxsize=8192)
 def _skip_url(url: str) -> bool:
-    path = urlparse(url).path.lower()
-    return any(path.endswith(ext) for ext in _SKIP_EXTENSIONS)
+    return urlparse(url).path.lower().endswith(_SKIP_EXTENSIONS)
+
+
+_NOISY_TAGS = ("script", "style", "nav", "footer", "header", "aside", "form")
+_CONTENT_ID_RE = re.compile(r"content|main", re.I)
+_CONTENT_SELECTOR = "h1,h2,h3,h4,p,li,code,pre"
 
 
 def _clean_text(soup: BeautifulSoup) -> str:
     """Extract readable text from a BeautifulSoup document."""
     # Remove noisy tags
-    for tag in soup(["script", "style", "nav", "footer", "header", "aside", "form"]):
+    for tag in soup(_NOISY_TAGS):
         tag.decompose()
 
     # Prefer <main> or <article> content if present
-    main = soup.find("main") or soup.find("article") or soup.find(id=re.compile(r"content|main", re.I))
+    main = soup.find("main") or soup.find("article") or soup.find(id=_CONTENT_ID_RE)
     target = main if main else soup.body or soup
 
     lines = []
-    for elem in target.descendants:
+    # select() returns matches in document order, like walking .descendants,
+    # but only visits the tags we render.
+    for elem in target.select(_CONTENT_SELECTOR):
         if elem.name in ("h1", "h2", "h3", "h4"):
             lines.append(f"\n## {elem.get_text(strip=True)}\n")
         elif elem.name == "li":
@@ -80,17 +180,60 @@ def _clean_text(soup: BeautifulSoup) -> str:
 
 def _extract_links(soup: BeautifulSoup, base_url: str) -> List[str]:
     """Return all absolute href links found on the page."""
-    links = []
+    links: List[str] = []
+    seen = set()
     for tag in soup.find_all("a", href=True):
         href = tag["href"].strip()
-        if href.startswith("#") or href.startswith("mailto:") or href.startswith("javascript:"):
+        if href[:1] == "#" or href.startswith(("mailto:", "javascript:")):
             continue
         full = urljoin(base_url, href)
         # Strip fragment
         full = full.split("#")[0]
-        if full and not _skip_url(full):
+        if full and full not in seen and not _skip_url(full):
+            seen.add(full)
             links.append(full)
-    return list(dict.fromkeys(links))  # deduplicate while preserving order
+    return links
+
+
+# Bodies are streamed and cut off at this size; documentation pages are far smaller.
+_MAX_BODY_BYTES = 2 * 1024 * 1024
+_BODY_CHUNK_BYTES = 64 * 1024
+_HTML_CONTENT_TYPES = ("text/html", "application/xhtml+xml")
+
+
+def _parse_page(html: str, url: str) -> PageResult:
+    """Parse fetched HTML into fetch_page's result (top-level so a process pool can run it)."""
+    soup = BeautifulSoup(html, _HTML_PARSER)
+    title = soup.title.string.strip() if soup.title else url
+    content = _clean_text(soup)
+    links = _extract_links(soup, url)
+    return {"url": url, "title": title, "content": content, "links": links, "error": None}
+
+
+# Parsing holds the GIL, so concurrent crawl threads parse one page at a time.
+# Pages at least this large are parsed in worker processes instead; smaller ones
+# parse faster inline than the round-trip to a worker costs.
+_PROCESS_PARSE_MIN_CHARS = 256 * 1024
+_PARSER_POOL: Optional[ProcessPoolExecutor] = None
+_PARSER_POOL_LOCK = threading.Lock()
+
+
+def _parser_pool() -> ProcessPoolExecutor:
+    global _PARSER_POOL
+    with _PARSER_POOL_LOCK:
+        if _PARSER_POOL is None:
+            # spawn: forking a process that runs crawl threads is unsafe
+            _PARSER_POOL = ProcessPoolExecutor(mp_context=multiprocessing.get_context("spawn"))
+        return _PARSER_POOL
+
+
+def _parse(html: str, url: str) -> PageResult:
+    if len(html) < _PROCESS_PARSE_MIN_CHARS:
+        return _parse_page(html, url)
+    try:
+        return _parser_pool().submit(_parse_page, html, url).result()
+    except (BrokenProcessPool, OSError):  # no worker processes available here
+        return _parse_page(html, url)
 
 
 # ---------------------------------------------------------------------------
@@ -98,7 +241,7 @@ def _extract_links(soup: BeautifulSoup, base_url: str) -> List[str]:
 # ---------------------------------------------------------------------------
 
 @register_tool
-def fetch_page(url: str) -> Dict[str, Any]:
+def fetch_page(url: str) -> PageResult:
     """
     Fetch a single web page and return its text content and all links found on it.
 
@@ -112,15 +255,103 @@ def fetch_page(url: str) -> Dict[str, Any]:
       }
     """
     try:
-        resp = _SESSION.get(url, timeout=15)
-        resp.raise_for_status()
-        soup = BeautifulSoup(resp.text, "html.parser")
-        title = soup.title.string.strip() if soup.title else url
-        content = _clean_text(soup)
-        links = _extract_links(soup, url)
-        return {"url": url, "title": title, "content": content, "links": links, "error": None}
+        with _SESSION.get(url, timeout=15, stream=True) as resp:
+            resp.raise_for_status()
+            # Checked as soon as the headers arrive; leaving the block closes the
+            # connection before a non-HTML body is downloaded.
+            content_type = resp.headers.get("content-type", "").lower()
+            if not content_type.startswith(_HTML_CONTENT_TYPES):
+                return _error_result(url, f"Skipped non-HTML content: {content_type or 'unknown'}")
+            html = _read_body(resp)
+        return _parse(html, url)
     except Exception as exc:
-        return {"url": url, "title": "", "content": "", "links": [], "error": str(exc)}
+        return _error_result(url, str(exc))
+
+
+def _read_body(resp: requests.Response) -> str:
+    """Read at most _MAX_BODY_BYTES of a streamed response and decode it."""
+    chunks: List[bytes] = []
+    total = 0
+    for chunk in resp.iter_content(_BODY_CHUNK_BYTES):
+        chunks.append(chunk)
+        total += len(chunk)
+        if total >= _MAX_BODY_BYTES:
+            break
+    body = b"".join(chunks)[:_MAX_BODY_BYTES]
+    return body.decode(resp.encoding or "utf-8", errors="replace")
+
+
+def _error_result(url: str, error: str) -> PageResult:
+    return {"url": url, "title": "", "content": "", "links": [], "error": error}
+
+
+class _VisitedFilter:
+    """
+    Bloom filter of URLs fetched by earlier crawls, persisted to a file.
+
+    Sized for *capacity* URLs at a *error_rate* false-positive rate (~1.8 MB for
+    the defaults). A false positive only means a page is skipped as already seen.
+    """
+
+    _MAGIC = b"ADCBLM1\0"
+
+    def __init__(self, path: str, capacity: int = 1_000_000, error_rate: float = 0.001) -> None:
+        self.path = Path(path)
+        self.bits = math.ceil(-capacity * math.log(error_rate) / math.log(2) ** 2)
+        self.hashes = max(1, round(self.bits / capacity * math.log(2)))
+        header = self._MAGIC + self.bits.to_bytes(8, "big") + self.hashes.to_bytes(2, "big")
+        self._header_size = len(header)
+        self._data = bytearray(header) + bytearray((self.bits + 7) // 8)
+        try:
+            stored = self.path.read_bytes()
+        except FileNotFoundError:
+            return
+        if stored[:self._header_size] == header and len(stored) == len(self._data):
+            self._data[:] = stored
+        # A file written with different parameters is ignored and overwritten on save()
+
+    def _positions(self, url: str):
+        digest = hashlib.blake2b(url.encode("utf-8"), digest_size=16).digest()
+        h1 = int.from_bytes(digest[:8], "big")
+        h2 = int.from_bytes(digest[8:], "big") | 1
+        for i in range(self.hashes):
+            yield (h1 + i * h2) % self.bits
+
+    def __contains__(self, url: str) -> bool:
+        data, offset = self._data, self._header_size
+        return all(data[offset + (pos >> 3)] & (1 << (pos & 7)) for pos in self._positions(url))
+
+    def add(self, url: str) -> None:
+        offset = self._header_size
+        for pos in self._positions(url):
+            self._data[offset + (pos >> 3)] |= 1 << (pos & 7)
+
+    def save(self) -> None:
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        tmp = self.path.with_name(self.path.name + ".tmp")
+        tmp.write_bytes(self._data)
+        os.replace(tmp, self.path)
+
+
+def _fetch_robots(scheme: str, netloc: str) -> Optional[RobotFileParser]:
+    """
+    Fetch and parse a host's robots.txt; None (no restrictions) if it can't be read.
+
+    Like RobotFileParser.read(), a 401/403 disallows the whole host while other
+    4xx responses mean there are no restrictions.
+    """
+    try:
+        resp = _SESSION.get(f"{scheme}://{netloc}/robots.txt", timeout=10)
+    except Exception:
+        return None
+    parser = RobotFileParser()
+    if resp.status_code in (401, 403):
+        parser.disallow_all = True
+        return parser
+    if resp.status_code >= 400:
+        return None
+    parser.parse(resp.text.splitlines())
+    return parser
 
 
 @register_tool
@@ -130,18 +361,28 @@ def crawl_docs(
     max_pages: int = 20,
     stay_on_origin: bool = True,
     delay_seconds: float = 0.3,
-) -> Dict[str, Any]:
+    concurrency: int = 20,
+    respect_robots: bool = False,
+    visited_db: Optional[str] = None,
+) -> CrawlResult:
     """
     Recursively crawl documentation starting from *urls*.
 
     Follows sublinks up to *max_depth* levels deep and collects at most *max_pages* pages.
+    Up to *concurrency* pages are fetched at once; requests to the same host are
+    still spaced *delay_seconds* apart.
 
     Args:
         urls:             Seed URLs to start crawling from.
         max_depth:        How many link-hops to follow from each seed (default 2).
         max_pages:        Maximum total pages to fetch (default 20).
         stay_on_origin:   If True, only follow links on the same domain as each seed (default True).
-        delay_seconds:    Polite delay between requests (default 0.3s).
+        delay_seconds:    Polite delay between requests to the same host (default 0.3s).
+        concurrency:      Maximum number of pages fetched in parallel (default 20).
+        respect_robots:   If True, skip URLs disallowed by each host's robots.txt and honour
+                          its Crawl-delay when longer than *delay_seconds* (default False).
+        visited_db:       Path of a file remembering pages fetched by earlier crawls. Linked
+                          pages found in it are skipped; seeds are always fetched (default None).
 
     Returns a dict:
       {
@@ -150,63 +391,143 @@ def crawl_docs(
         "total_fetched": int
       }
     """
-    visited: set[str] = set()
-    # queue items: (url, depth, origin_url)
-    queue: deque[tuple[str, int, str]] = deque()
+    return _run_sync(_crawl_docs_async(
+        urls, max_depth, max_pages, stay_on_origin, delay_seconds, concurrency, respect_robots, visited_db
+    ))
 
-    for seed in urls:
-        seed = seed.split("#")[0]
-        queue.append((seed, 0, seed))
 
-    pages: List[Dict[str, Any]] = []
-    skipped: List[str] = []
+def _run_sync(coro: Coroutine[Any, Any, Any]) -> Any:
+    """Run *coro* to completion, on a helper thread if this thread already runs an event loop."""
+    try:
+        asyncio.get_running_loop()
+    except RuntimeError:
+        return asyncio.run(coro)
+    # Called as a tool from inside an agent's event loop.
+    with ThreadPoolExecutor(max_workers=1) as ex:
+        return ex.submit(asyncio.run, coro).result()
 
-    while queue and len(pages) < max_pages:
-        url, depth, origin = queue.popleft()
 
-        if url in visited:
-            continue
-        if _skip_url(url):
-            skipped.append(url)
-            continue
+async def _crawl_docs_async(
+    urls: List[str],
+    max_depth: int,
+    max_pages: int,
+    stay_on_origin: bool,
+    delay_seconds: float,
+    concurrency: int,
+    respect_robots: bool = False,
+    visited_db: Optional[str] = None,
+) -> CrawlResult:
+    # Pages fetched by previous crawls. Only consulted for linked pages, never for
+    # the seeds, so a re-crawl still discovers pages added since the last run.
+    visited = _VisitedFilter(visited_db) if visited_db else None
+    # Every URL ever queued. Links are checked against it before being queued, so
+    # each URL enters a frontier once and frontiers stay O(pages), not O(links).
+    seen: set[str] = set()
+    # Breadth-first, one depth level at a time; frontier items are
+    # (url, origin key of the seed it was reached from)
+    frontier: List[Tuple[str, Tuple[str, str]]] = []
 
-        visited.add(url)
-        result = fetch_page(url)
+    for seed in urls:
+        seed = seed.split("#")[0]
+        if seed not in seen:
+            seen.add(seed)
+            frontier.append((seed, _origin_key(seed)))
 
-        if result["error"]:
-            skipped.append(url)
-            continue
+    pages: List[PageRecord] = []
+    skipped: List[str] = []
+    in_flight = asyncio.Semaphore(max(1, concurrency))
+    # A pool of its own: the loop's default executor has only min(32, cpus + 4)
+    # workers, which would silently cap *concurrency* on small machines.
+    fetch_pool = ThreadPoolExecutor(max_workers=max(1, concurrency), thread_name_prefix="crawl-fetch")
+    host_locks: Dict[str, asyncio.Lock] = {}
+    host_next: Dict[str, float] = {}  # earliest time the next request to a host may start
+    # robots.txt per origin, fetched once per crawl by whichever URL needs it first
+    robots: Dict[Tuple[str, str], asyncio.Task] = {}
+
+    async def polite_fetch(url: str) -> PageResult:
+        async with in_flight:
+            key = _origin_key(url)
+            host = key[1]
+            delay = delay_seconds
+            if respect_robots:
+                if key not in robots:
+                    robots[key] = asyncio.ensure_future(asyncio.to_thread(_fetch_robots, *key))
+                rules = await robots[key]
+                if rules is not None:
+                    agent = _SESSION.headers["User-Agent"]
+                    if not rules.can_fetch(agent, url):
+                        return _error_result(url, "Disallowed by robots.txt")
+                    delay = max(delay, float(rules.crawl_delay(agent) or 0))
+            if delay > 0:
+                async with host_locks.setdefault(host, asyncio.Lock()):
+                    wait = host_next.get(host, 0.0) - time.monotonic()
+                    if wait > 0:
+                        await asyncio.sleep(wait)
+                    host_next[host] = time.monotonic() + delay
+            # fetch_page blocks on the network and on parsing; keep both off the loop
+            return await asyncio.get_running_loop().run_in_executor(fetch_pool, fetch_page, url)
 
-        pages.append({
-            "url": url,
-            "title": result["title"],
-            "content": result["content"],
-            "depth": depth,
-        })
-
-        # Enqueue sublinks if we haven't hit max depth
-        if depth < max_depth:
-            for link in result["links"]:
-                if link not in visited:
-                    if stay_on_origin and not _same_origin(origin, link):
+    try:
+        for depth in range(max_depth + 1):
+            if not frontier or len(pages) >= max_pages:
+                break
+            pending: List[Tuple[str, Tuple[str, str]]] = []
+            for url, origin in frontier:
+                if _skip_url(url) or (visited is not None and depth and url in visited):
+                    skipped.append(url)
+                else:
+                    pending.append((url, origin))
+
+            next_frontier: List[Tuple[str, Tuple[str, str]]] = []
+            # Fetch the level in batches no larger than the pages still allowed, topping
+            # up from the rest of the level when some fetches fail.
+            while pending and len(pages) < max_pages:
+                batch, pending = pending[:max_pages - len(pages)], pending[max_pages - len(pages):]
+                results = await asyncio.gather(*(polite_fetch(url) for url, _ in batch))
+
+                for (url, origin), result in zip(batch, results):
+                    if result["error"]:
+                        skipped.append(url)
                         continue
-                    queue.append((link, depth + 1, origin))
-
-        if delay_seconds > 0:
-            time.sleep(delay_seconds)
 
-    # Any remaining queue items that weren't fetched due to max_pages
-    skipped.extend(item[0] for item in queue if item[0] not in visited)
+                    if visited is not None:
+                        visited.add(url)
+                    pages.append({
+                        "url": url,
+                        "title": result["title"],
+                        "content": result["content"],
+                        "depth": depth,
+                    })
+
+                    # Queue sublinks for the next level if we haven't hit max depth
+                    if depth < max_depth:
+                        for link in result["links"]:
+                            if link in seen:
+                                continue
+                            if stay_on_origin and _origin_key(link) != origin:
+                                continue
+                            seen.add(link)
+                            next_frontier.append((link, origin))
+
+            # Anything left on this level wasn't fetched due to max_pages
+            skipped.extend(url for url, _ in pending)
+            frontier = next_frontier
+    finally:
+        fetch_pool.shutdown(wait=False, cancel_futures=True)
+
+    skipped.extend(url for url, _ in frontier)
+    if visited is not None:
+        await asyncio.to_thread(visited.save)
 
     return {
         "pages": pages,
-        "skipped": list(dict.fromkeys(skipped)),
+        "skipped": skipped,
         "total_fetched": len(pages),
     }
 
 
 @register_tool
-def summarise_crawl(crawl_result: Dict[str, Any]) -> str:
+def summarise_crawl(crawl_result: CrawlResult) -> str:
     """
     Format the output of crawl_docs() into a single readable text document
     suitable for the agent to analyse and summarise.
@@ -217,14 +538,18 @@ def summarise_crawl(crawl_result: Dict[str, Any]) -> str:
     if not pages:
         return "No pages were fetched."
 
-    sections = []
-    for page in pages:
-        depth_label = "  " * page["depth"]
-        header = f"{depth_label}# [{page['title']}]({page['url']})  _(depth {page['depth']})_"
-        sections.append(f"{header}\n\n{page['content']}")
-
-    footer = (
+    # Written straight into one buffer so page contents aren't copied into
+    # per-page section strings first.
+    buf = io.StringIO()
+    for i, page in enumerate(pages):
+        if i:
+            buf.write("\n\n---\n\n")
+        buf.write("  " * page["depth"])
+        buf.write(f"# [{page['title']}]({page['url']})  _(depth {page['depth']})_\n\n")
+        buf.write(page["content"])
+
+    buf.write(
         f"\n\n---\n_Crawled {len(pages)} pages. "
         f"Skipped {len(crawl_result.get('skipped', []))} pages._"
     )
-    return "\n\n---\n\n".join(sections) + footer
+    return buf.getvalue()